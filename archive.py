@@ -0,0 +1,211 @@
+"""
+Append-only archive of completed calls.
+
+Raw rows go to the `calls` table (indexed by time and country); every insert
+also bumps per-bucket counters in `call_counts`, so "calls per country in the
+last hour" or "top DID prefixes today" only read a handful of pre-aggregated
+rows no matter how many calls are stored. Old raw rows and counters are
+dropped by compact() according to the retention settings.
+
+RollingCounts keeps the same counters for the last day in memory, so bot
+commands never wait on SQLite (compaction holds the archive lock).
+"""
+import time
+import sqlite3
+import threading
+
+
+class CallArchive:
+    """SQLite call history with rolling per-bucket counters"""
+
+    def __init__(self, path, bucket_seconds=60, prefix_len=4):
+        self.path = path
+        self.bucket_seconds = bucket_seconds
+        self.prefix_len = prefix_len
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS calls (
+                id INTEGER PRIMARY KEY,
+                call_uuid TEXT,
+                did TEXT NOT NULL,
+                country TEXT,
+                flag TEXT,
+                detected_at REAL NOT NULL,
+                completed_at REAL,
+                duration REAL,
+                download_ok INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS calls_detected_at ON calls (detected_at);
+            CREATE INDEX IF NOT EXISTS calls_country_time ON calls (country, detected_at);
+            CREATE INDEX IF NOT EXISTS calls_uuid ON calls (call_uuid);
+
+            CREATE TABLE IF NOT EXISTS call_counts (
+                bucket INTEGER NOT NULL,
+                country TEXT NOT NULL,
+                prefix TEXT NOT NULL,
+                flag TEXT,
+                calls INTEGER NOT NULL DEFAULT 0,
+                downloads_ok INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (bucket, country, prefix)
+            ) WITHOUT ROWID;
+        """)
+
+    def _bucket(self, timestamp):
+        return int(timestamp // self.bucket_seconds) * self.bucket_seconds
+
+    def record(self, call_uuid, did, country, flag, detected_at, completed_at, download_ok):
+        """Append one completed call (timestamps are epoch seconds)"""
+        duration = completed_at - detected_at if completed_at and detected_at else None
+        prefix = did[:self.prefix_len]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute(
+                    "INSERT INTO calls (call_uuid, did, country, flag, detected_at, completed_at, duration, download_ok)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (call_uuid, did, country, flag, detected_at, completed_at, duration, int(bool(download_ok))),
+                )
+                self._conn.execute(
+                    "INSERT INTO call_counts (bucket, country, prefix, flag, calls, downloads_ok) VALUES (?, ?, ?, ?, 1, ?)"
+                    " ON CONFLICT (bucket, country, prefix) DO UPDATE SET"
+                    " calls = calls + 1, downloads_ok = downloads_ok + excluded.downloads_ok",
+                    (self._bucket(detected_at), country, prefix, flag, int(bool(download_ok))),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def has_call(self, call_uuid):
+        """Check whether a call uuid is already archived"""
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM calls WHERE call_uuid = ? LIMIT 1", (call_uuid,)).fetchone()
+        return row is not None
+
+    def calls_per_country(self, since_seconds=3600, limit=10):
+        """[(country, flag, calls)] for the last since_seconds, busiest first"""
+        since = self._bucket(time.time() - since_seconds)
+        with self._lock:
+            return self._conn.execute(
+                "SELECT country, MAX(flag), SUM(calls) AS total FROM call_counts WHERE bucket >= ?"
+                " GROUP BY country ORDER BY total DESC LIMIT ?",
+                (since, limit),
+            ).fetchall()
+
+    def top_prefixes(self, since_seconds=86400, limit=10):
+        """[(prefix, calls)] for the last since_seconds, busiest first"""
+        since = self._bucket(time.time() - since_seconds)
+        with self._lock:
+            return self._conn.execute(
+                "SELECT prefix, SUM(calls) AS total FROM call_counts WHERE bucket >= ?"
+                " GROUP BY prefix ORDER BY total DESC LIMIT ?",
+                (since, limit),
+            ).fetchall()
+
+    def totals(self, since_seconds=3600):
+        """(calls, downloads_ok) for the last since_seconds"""
+        since = self._bucket(time.time() - since_seconds)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COALESCE(SUM(calls), 0), COALESCE(SUM(downloads_ok), 0) FROM call_counts WHERE bucket >= ?",
+                (since,),
+            ).fetchone()
+        return row[0], row[1]
+
+    def recent_counts(self, since_seconds=86400):
+        """Raw counter rows [(bucket, country, prefix, flag, calls, downloads_ok)] for seeding RollingCounts"""
+        since = self._bucket(time.time() - since_seconds)
+        with self._lock:
+            return self._conn.execute(
+                "SELECT bucket, country, prefix, flag, calls, downloads_ok FROM call_counts WHERE bucket >= ?",
+                (since,),
+            ).fetchall()
+
+    def compact(self, retention_days, counter_retention_days):
+        """Drop raw calls / counters past retention (0 keeps forever) and free pages"""
+        now = time.time()
+        removed = 0
+        with self._lock:
+            if retention_days:
+                cur = self._conn.execute("DELETE FROM calls WHERE detected_at < ?", (now - retention_days * 86400,))
+                removed += cur.rowcount
+            if counter_retention_days:
+                cur = self._conn.execute(
+                    "DELETE FROM call_counts WHERE bucket < ?",
+                    (self._bucket(now - counter_retention_days * 86400),),
+                )
+                removed += cur.rowcount
+            if removed:
+                self._conn.execute("PRAGMA incremental_vacuum")
+        return removed
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class RollingCounts:
+    """In-memory per-bucket counters for the last `window` seconds (same queries as CallArchive)"""
+
+    def __init__(self, bucket_seconds=60, window=86400, prefix_len=4):
+        self.bucket_seconds = bucket_seconds
+        self.window = window
+        self.prefix_len = prefix_len
+        self._buckets = {}  # bucket -> {(country, prefix): [flag, calls, downloads_ok]}
+        self._lock = threading.Lock()
+
+    def _bucket(self, timestamp):
+        return int(timestamp // self.bucket_seconds) * self.bucket_seconds
+
+    def _add(self, bucket, country, prefix, flag, calls, downloads_ok):
+        entry = self._buckets.setdefault(bucket, {}).setdefault((country, prefix), [flag, 0, 0])
+        entry[1] += calls
+        entry[2] += downloads_ok
+
+    def load(self, rows):
+        """Seed from CallArchive.recent_counts()"""
+        with self._lock:
+            for bucket, country, prefix, flag, calls, downloads_ok in rows:
+                self._add(bucket, country, prefix, flag, calls, downloads_ok)
+
+    def record(self, did, country, flag, detected_at, download_ok):
+        """Count one completed call (detected_at is epoch seconds)"""
+        cutoff = self._bucket(time.time() - self.window)
+        with self._lock:
+            self._add(self._bucket(detected_at), country, did[:self.prefix_len], flag, 1, int(bool(download_ok)))
+            for bucket in [b for b in self._buckets if b < cutoff]:
+                del self._buckets[bucket]
+
+    def _entries(self, since_seconds):
+        since = self._bucket(time.time() - since_seconds)
+        with self._lock:
+            return [
+                (country, prefix, flag, calls, downloads_ok)
+                for bucket, entries in self._buckets.items() if bucket >= since
+                for (country, prefix), (flag, calls, downloads_ok) in entries.items()
+            ]
+
+    def calls_per_country(self, since_seconds=3600, limit=10):
+        """[(country, flag, calls)] for the last since_seconds, busiest first"""
+        totals = {}
+        for country, _, flag, calls, _ in self._entries(since_seconds):
+            current = totals.get(country, (flag, 0))
+            totals[country] = (max(current[0] or "", flag or ""), current[1] + calls)
+        ranked = sorted(totals.items(), key=lambda item: -item[1][1])[:limit]
+        return [(country, flag, calls) for country, (flag, calls) in ranked]
+
+    def top_prefixes(self, since_seconds=86400, limit=10):
+        """[(prefix, calls)] for the last since_seconds, busiest first"""
+        totals = {}
+        for _, prefix, _, calls, _ in self._entries(since_seconds):
+            totals[prefix] = totals.get(prefix, 0) + calls
+        return sorted(totals.items(), key=lambda item: -item[1])[:limit]
+
+    def totals(self, since_seconds=3600):
+        """(calls, downloads_ok) for the last since_seconds"""
+        entries = self._entries(since_seconds)
+        return sum(e[3] for e in entries), sum(e[4] for e in entries)
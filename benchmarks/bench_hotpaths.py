@@ -0,0 +1,193 @@
+"""
+Microbenchmarks for the per-call / per-row pure-Python paths in main.py.
+
+Runs each hot path over a fixed synthetic corpus (same seed every run) and
+compares the per-item cost against benchmarks/baseline.json. Costs are
+stored relative to a fixed calibration loop timed right next to each
+benchmark, so the baseline carries over between machines and CPU speeds.
+
+    python benchmarks/bench_hotpaths.py                    # compare with baseline
+    python benchmarks/bench_hotpaths.py --update-baseline  # record new baseline
+
+Exits with status 1 when a benchmark is slower than baseline * (1 + tolerance).
+Relative costs still shift a little between Python versions; re-record the
+baseline after upgrading the interpreter.
+"""
+import os
+import sys
+import json
+import random
+import timeit
+import statistics
+import argparse
+import warnings
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+warnings.filterwarnings("ignore")  # pydub warns when ffmpeg is missing
+
+import main
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+SEED = 20260118
+CALIBRATION_ITEMS = 100_000
+
+# Country calling codes seen on the live table (plus a few odd ones)
+CALLING_CODES = ["1", "7", "20", "44", "52", "55", "91", "92", "234", "263", "380", "855", "880", "971", "998"]
+
+TRANSCRIPT_TEMPLATES = [
+    "Your verification code is {otp}. Do not share it with anyone.",
+    "Hello, your code: {otp}, I repeat, {otp}",
+    "{otp} is your one time password",
+    "Su código de verificación es {otp}",
+    "Please enter the PIN {otp} to continue",
+    "Thank you for calling, goodbye",
+    "your otp {otp} expires in {mins} minutes",
+    "Call back at {phone} for support",
+]
+
+
+def build_corpus(rng):
+    """Fixed synthetic inputs for every benchmark"""
+    dids = [
+        rng.choice(CALLING_CODES) + "".join(rng.choice("0123456789") for _ in range(rng.randint(7, 10)))
+        for _ in range(100_000)
+    ]
+    transcripts = [
+        rng.choice(TRANSCRIPT_TEMPLATES).format(
+            otp=rng.randint(1000, 999999), mins=rng.randint(1, 15), phone=rng.randint(10**9, 10**10)
+        )
+        for _ in range(5_000)
+    ]
+    region_codes = [rng.choice(["US", "GB", "MX", "IN", "PK", "ZW", "UA", "KH", "xx", ""]) for _ in range(100_000)]
+
+    base_time = datetime(2026, 1, 18, 12, 0, 0)
+    call_infos = [
+        {
+            "did_number": did,
+            "flag": "🇲🇽",
+            "country": "Mexico",
+            "detected_at": base_time + timedelta(seconds=i),
+        }
+        for i, did in enumerate(dids[:20_000])
+    ]
+
+    # Scan diffs: ~150 tracked calls, each scan drops a few and adds a few
+    scans = []
+    active = {f"uuid-{i}": {} for i in range(150)}
+    next_id = 150
+    for _ in range(2_000):
+        current = {call_id: "1" for call_id in active if rng.random() > 0.03}
+        for _ in range(rng.randint(0, 5)):
+            current[f"uuid-{next_id}"] = "1"
+            next_id += 1
+        processing = {call_id: None for call_id in list(active)[:2]}
+        scans.append((dict(active), current, processing))
+        active = {call_id: {} for call_id in current}
+
+    return {
+        "dids": dids,
+        "transcripts": transcripts,
+        "region_codes": region_codes,
+        "call_infos": call_infos,
+        "scans": scans,
+    }
+
+
+def calibration():
+    """Fixed pure-Python workload (str/dict/list ops) that serves as the unit of cost"""
+    table = {}
+    for i in range(CALIBRATION_ITEMS):
+        key = str(i)
+        table[key] = key[::-1] + "-" + key[:2]
+    return sum(len(value) for value in table.values() if value[0] != "0")
+
+
+def benchmarks(corpus):
+    """name -> (callable running the whole corpus once, number of items)"""
+    return {
+        "detect_country": (lambda: [main.detect_country(did) for did in corpus["dids"]], len(corpus["dids"])),
+        "country_to_flag": (
+            lambda: [main.country_to_flag(code) for code in corpus["region_codes"]],
+            len(corpus["region_codes"]),
+        ),
+        "find_otp_in_text": (
+            lambda: [main.find_otp_in_text(text) for text in corpus["transcripts"]],
+            len(corpus["transcripts"]),
+        ),
+        "mask_number": (lambda: [main.mask_number(did) for did in corpus["dids"]], len(corpus["dids"])),
+        "build_group_caption": (
+            lambda: [main.build_group_caption(info, "📳 New Call Captured!") for info in corpus["call_infos"]],
+            len(corpus["call_infos"]),
+        ),
+        "diff_calls": (
+            lambda: [main.diff_calls(active, current, processing) for active, current, processing in corpus["scans"]],
+            len(corpus["scans"]),
+        ),
+    }
+
+
+def timed(func):
+    return timeit.timeit(func, number=1)
+
+
+def run(repeat):
+    """name -> cost per item in calibration units (median over repeats)"""
+    corpus = build_corpus(random.Random(SEED))
+    results = {}
+    for name, (func, items) in benchmarks(corpus).items():
+        # Calibrate right before and after every run so throttling or a busy
+        # neighbour slows both sides of the ratio alike
+        ratios = []
+        costs = []
+        for _ in range(repeat):
+            before = timed(calibration)
+            cost = timed(func)
+            after = timed(calibration)
+            costs.append(cost / items * 1e9)
+            ratios.append((cost / items) / ((before + after) / 2 / CALIBRATION_ITEMS))
+        results[name] = statistics.median(ratios)
+        print(f"{name:<22} {min(costs):>12.1f} ns/item  {results[name]:>9.2f} units  ({items} items)")
+    return results
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--update-baseline", action="store_true", help="write results to baseline.json")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown (0.25 = 25%%)")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per benchmark, the median ratio counts")
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+
+    if args.update_baseline:
+        with open(BASELINE_FILE, "w") as f:
+            json.dump({name: round(value, 3) for name, value in results.items()}, f, indent=2)
+            f.write("\n")
+        print(f"Baseline written to {BASELINE_FILE}")
+        return 0
+
+    try:
+        with open(BASELINE_FILE, "r") as f:
+            baseline = json.load(f)
+    except OSError:
+        print("No baseline recorded, run with --update-baseline")
+        return 0
+
+    regressions = []
+    print()
+    for name, value in results.items():
+        if name not in baseline:
+            print(f"{name:<22} no baseline")
+            continue
+        change = value / baseline[name] - 1
+        status = "REGRESSION" if change > args.tolerance else "ok"
+        print(f"{name:<22} {change:+7.1%} vs baseline  {status}")
+        if change > args.tolerance:
+            regressions.append(name)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
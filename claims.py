@@ -0,0 +1,267 @@
+"""
+Shared call claims for running several monitor instances on one account.
+
+Every instance tries to claim a key (e.g. "<call_uuid>:admin") before it
+posts; only the first claim succeeds, so each call is announced once no
+matter how many instances saw it. A claim taken with a lease expires unless
+the owner marks it finished, so another instance can take over work whose
+owner crashed or restarted half way. Backends are picked by URL:
+
+    memory://                   single instance (default)
+    sqlite:///tmp/claims.db     instances on the same host / shared volume
+    file:///tmp/claims          one lock file per claim
+
+Other backends (Redis, Postgres, ...) can be added with register_backend().
+"""
+import os
+import json
+import time
+import sqlite3
+import threading
+
+
+def _lease_expired(expires_at, done, now):
+    return not done and expires_at is not None and expires_at < now
+
+
+class MemoryClaimStore:
+    """In-process claims, only dedups within one instance"""
+
+    def __init__(self):
+        self._claims = {}
+        self._lock = threading.Lock()
+
+    def claim(self, key, owner, lease=None):
+        """Claim key for owner, returns False if someone else holds it.
+
+        With a lease (seconds) the claim expires unless finish() is called;
+        an expired, unfinished claim can be taken over by another owner.
+        """
+        now = time.time()
+        expires_at = now + lease if lease else None
+        with self._lock:
+            current = self._claims.get(key)
+            if current is not None and current[0] != owner and not _lease_expired(current[2], current[3], now):
+                return False
+            self._claims[key] = (owner, now, expires_at, False)
+            return True
+
+    def finish(self, key, owner):
+        """Mark owner's claim as done so it never expires"""
+        with self._lock:
+            current = self._claims.get(key)
+            if current is not None and current[0] == owner:
+                self._claims[key] = (owner, current[1], None, True)
+
+    def is_claimed(self, key):
+        """Check whether anyone (including us) holds a live or finished claim on key"""
+        with self._lock:
+            current = self._claims.get(key)
+            return current is not None and not _lease_expired(current[2], current[3], time.time())
+
+    def is_done(self, key):
+        """Check whether the claim on key was marked finished"""
+        with self._lock:
+            current = self._claims.get(key)
+            return current is not None and current[3]
+
+    def release(self, key, owner):
+        """Give up a claim so another instance can take it"""
+        with self._lock:
+            if self._claims.get(key, (None,))[0] == owner:
+                del self._claims[key]
+
+    def prune(self, max_age):
+        """Drop claims older than max_age seconds, returns number removed"""
+        cutoff = time.time() - max_age
+        with self._lock:
+            stale = [k for k, (_, claimed_at, _, _) in self._claims.items() if claimed_at < cutoff]
+            for key in stale:
+                del self._claims[key]
+        return len(stale)
+
+
+class SQLiteClaimStore:
+    """Claims in a SQLite file shared by all instances"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=5, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS claims ("
+            " key TEXT PRIMARY KEY, owner TEXT NOT NULL, claimed_at REAL NOT NULL,"
+            " expires_at REAL, done INTEGER NOT NULL DEFAULT 0)"
+        )
+        # Stores created before leases existed
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(claims)")}
+        if "expires_at" not in columns:
+            self._conn.execute("ALTER TABLE claims ADD COLUMN expires_at REAL")
+            self._conn.execute("ALTER TABLE claims ADD COLUMN done INTEGER NOT NULL DEFAULT 0")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS claims_claimed_at ON claims (claimed_at)")
+
+    def claim(self, key, owner, lease=None):
+        now = time.time()
+        expires_at = now + lease if lease else None
+        with self._lock:
+            # Insert, re-claim our own key, or take over an expired unfinished lease
+            cur = self._conn.execute(
+                "INSERT INTO claims (key, owner, claimed_at, expires_at, done) VALUES (?, ?, ?, ?, 0)"
+                " ON CONFLICT (key) DO UPDATE SET"
+                " owner = excluded.owner, claimed_at = excluded.claimed_at, expires_at = excluded.expires_at, done = 0"
+                " WHERE claims.owner = excluded.owner"
+                " OR (claims.done = 0 AND claims.expires_at IS NOT NULL AND claims.expires_at < excluded.claimed_at)",
+                (key, owner, now, expires_at),
+            )
+            return cur.rowcount == 1
+
+    def finish(self, key, owner):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE claims SET done = 1, expires_at = NULL WHERE key = ? AND owner = ?", (key, owner)
+            )
+
+    def is_claimed(self, key):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM claims WHERE key = ? AND (done = 1 OR expires_at IS NULL OR expires_at >= ?)",
+                (key, time.time()),
+            ).fetchone()
+            return row is not None
+
+    def is_done(self, key):
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM claims WHERE key = ? AND done = 1", (key,)).fetchone() is not None
+
+    def release(self, key, owner):
+        with self._lock:
+            self._conn.execute("DELETE FROM claims WHERE key = ? AND owner = ?", (key, owner))
+
+    def prune(self, max_age):
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM claims WHERE claimed_at < ?", (time.time() - max_age,))
+            return cur.rowcount
+
+
+class FileClaimStore:
+    """Claims as lock files created with O_EXCL in a shared directory"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        safe_key = "".join(c if c.isalnum() or c in "-_." else "_" for c in key)
+        return os.path.join(self.directory, safe_key + ".claim")
+
+    def _read(self, path):
+        """(owner, expires_at, done) stored in a claim file"""
+        with open(path, "r") as f:
+            content = f.read()
+        try:
+            data = json.loads(content)
+            return data["owner"], data.get("expires_at"), data.get("done", False)
+        except (ValueError, TypeError, KeyError):
+            # Claim files written before leases only hold the owner
+            return content, None, False
+
+    def _write(self, path, owner, expires_at, done):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"owner": owner, "expires_at": expires_at, "done": done}, f)
+        os.replace(tmp_path, path)
+
+    def claim(self, key, owner, lease=None):
+        path = self._path(key)
+        now = time.time()
+        expires_at = now + lease if lease else None
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            return self._take_over(path, owner, expires_at, now)
+        with os.fdopen(fd, "w") as f:
+            json.dump({"owner": owner, "expires_at": expires_at, "done": False}, f)
+        return True
+
+    def _take_over(self, path, owner, expires_at, now):
+        """Re-claim our own key or an expired unfinished lease, serialized by a lock file"""
+        lock_path = path + ".lock"
+        try:
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+        except OSError:
+            return False
+        try:
+            current_owner, current_expires, done = self._read(path)
+            if current_owner != owner and not _lease_expired(current_expires, done, now):
+                return False
+            self._write(path, owner, expires_at, False)
+            return True
+        except OSError:
+            return False
+        finally:
+            os.remove(lock_path)
+
+    def finish(self, key, owner):
+        path = self._path(key)
+        try:
+            current_owner, _, _ = self._read(path)
+            if current_owner == owner:
+                self._write(path, owner, None, True)
+        except OSError:
+            pass
+
+    def is_claimed(self, key):
+        try:
+            _, expires_at, done = self._read(self._path(key))
+        except OSError:
+            return False
+        return not _lease_expired(expires_at, done, time.time())
+
+    def is_done(self, key):
+        try:
+            return bool(self._read(self._path(key))[2])
+        except OSError:
+            return False
+
+    def release(self, key, owner):
+        path = self._path(key)
+        try:
+            if self._read(path)[0] != owner:
+                return
+            os.remove(path)
+        except OSError:
+            pass
+
+    def prune(self, max_age):
+        cutoff = time.time() - max_age
+        removed = 0
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            try:
+                if name.endswith(".claim") and os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+
+BACKENDS = {
+    "memory": lambda location: MemoryClaimStore(),
+    "sqlite": SQLiteClaimStore,
+    "file": FileClaimStore,
+}
+
+
+def register_backend(scheme, factory):
+    """Register a claim store factory taking the location part of the URL"""
+    BACKENDS[scheme] = factory
+
+
+def open_claim_store(url):
+    """Open a claim store from a URL like "sqlite:///tmp/claims.db" """
+    scheme, _, location = (url or "memory://").partition("://")
+    if scheme not in BACKENDS:
+        raise ValueError(f"Unknown claim store backend: {scheme}")
+    return BACKENDS[scheme](location)
@@ -19,6 +19,15 @@ if IS_HEROKU:
     CALL_URL = os.environ.get('CALL_URL', 'https://www.orangecarrier.com/live/calls')
     BASE_URL = os.environ.get('BASE_URL', 'https://www.orangecarrier.com')
     
+    # Call history/CDR page used to backfill calls missed during downtime (empty = off)
+    HISTORY_URL = os.environ.get('HISTORY_URL', '')
+    BACKFILL_CONCURRENCY = int(os.environ.get('BACKFILL_CONCURRENCY', '3'))
+    BACKFILL_GAP_SECONDS = int(os.environ.get('BACKFILL_GAP_SECONDS', '60'))
+    BACKFILL_MAX_AGE = int(os.environ.get('BACKFILL_MAX_AGE', '3600'))  # never backfill calls older than this
+    # Last scan time, kept across restarts (point it at persistent storage; /tmp is wiped on dyno restart)
+    BACKFILL_STATE_FILE = os.environ.get('BACKFILL_STATE_FILE', '/tmp/backfill_state.json')
+    HISTORY_TIME_OFFSET_MINUTES = int(os.environ.get('HISTORY_TIME_OFFSET_MINUTES', '0'))  # history page clock - local clock
+    
     # Cookies from environment variable (JSON string)
     cookies_env = os.environ.get('ORANGE_COOKIES', '')
     ORANGE_COOKIES = json.loads(cookies_env) if cookies_env else []
@@ -26,6 +35,49 @@ if IS_HEROKU:
     # Settings
     MAX_ERRORS = int(os.environ.get('MAX_ERRORS', '10'))
     CHECK_INTERVAL = int(os.environ.get('CHECK_INTERVAL', '5'))
+    TELEGRAM_WORKERS = int(os.environ.get('TELEGRAM_WORKERS', '8'))
+    
+    # Hot reload: JSON file with ORANGE_COOKIES / settings, watched while running
+    RELOAD_FILE = os.environ.get('RELOAD_FILE', '')
+    
+    # Fast start: inject cookies via CDP before the first navigation
+    FAST_START = os.environ.get('FAST_START', '1') == '1'
+    
+    # Persistent Chrome profile (warm restarts, suffixed with INSTANCE_ID when set) and optional tarball snapshot
+    CHROME_PROFILE_DIR = os.environ.get('CHROME_PROFILE_DIR', '')
+    CHROME_PROFILE_SNAPSHOT = os.environ.get('CHROME_PROFILE_SNAPSHOT', '')
+    
+    # Redundant instances: shared claim store (memory://, sqlite:///path, file:///dir)
+    CLAIM_STORE = os.environ.get('CLAIM_STORE', 'memory://')
+    CLAIM_TTL = int(os.environ.get('CLAIM_TTL', '86400'))
+    CLAIM_LEASE = int(os.environ.get('CLAIM_LEASE', '600'))  # unfinished group posts are taken over after this
+    INSTANCE_ID = os.environ.get('INSTANCE_ID', '')
+    
+    # Call history archive (empty path disables), retention in days (0 = forever)
+    ARCHIVE_DB = os.environ.get('ARCHIVE_DB', '/tmp/calls.db')
+    ARCHIVE_BUCKET_SECONDS = int(os.environ.get('ARCHIVE_BUCKET_SECONDS', '60'))
+    ARCHIVE_RETENTION_DAYS = int(os.environ.get('ARCHIVE_RETENTION_DAYS', '30'))
+    ARCHIVE_COUNTER_RETENTION_DAYS = int(os.environ.get('ARCHIVE_COUNTER_RETENTION_DAYS', '365'))
+    
+    # Answer /status, /active, /stats from admin chats
+    COMMANDS_ENABLED = os.environ.get('COMMANDS_ENABLED', '1') == '1'
+    
+    # Memory guards (R14): caps, eviction ages in seconds, Chrome memory limit in MB (0 = off)
+    MEMORY_CHECK_INTERVAL = int(os.environ.get('MEMORY_CHECK_INTERVAL', '60'))
+    MEMORY_REPORT_INTERVAL = int(os.environ.get('MEMORY_REPORT_INTERVAL', '900'))
+    TRACEMALLOC = os.environ.get('TRACEMALLOC', '0') == '1'
+    MAX_ACTIVE_CALLS = int(os.environ.get('MAX_ACTIVE_CALLS', '500'))
+    STALE_CALL_SECONDS = int(os.environ.get('STALE_CALL_SECONDS', '3600'))
+    PROCESSING_TIMEOUT = int(os.environ.get('PROCESSING_TIMEOUT', '600'))
+    BROWSER_RSS_LIMIT_MB = int(os.environ.get('BROWSER_RSS_LIMIT_MB', '350'))  # compared with Chrome's total PSS
+    MEMORY_REFRESH_COOLDOWN = int(os.environ.get('MEMORY_REFRESH_COOLDOWN', '900'))
+    
+    # On-demand profiling (kill -USR1 <pid>): duration in seconds and output folder
+    PROFILE_SECONDS = int(os.environ.get('PROFILE_SECONDS', '30'))
+    PROFILE_DIR = os.environ.get('PROFILE_DIR', '/tmp/profiles')
+    
+    # Extra call event outputs, comma-separated: jsonl:<path>, webhook:<url>, socket:<path|host:port>
+    OUTPUT_SINKS = os.environ.get('OUTPUT_SINKS', '')
     
 else:
     # Local development Configuration
@@ -42,6 +94,14 @@ else:
     CALL_URL = 'https://www.orangecarrier.com/live/calls'
     BASE_URL = 'https://www.orangecarrier.com'
     
+    # Call history/CDR page used to backfill calls missed during downtime (empty = off)
+    HISTORY_URL = ''
+    BACKFILL_CONCURRENCY = 3
+    BACKFILL_GAP_SECONDS = 60
+    BACKFILL_MAX_AGE = 3600  # never backfill calls older than this
+    BACKFILL_STATE_FILE = './backfill_state.json'  # last scan time, kept across restarts
+    HISTORY_TIME_OFFSET_MINUTES = 0  # history page clock - local clock
+    
     # Cookies (paste your cookies here as Python list)
     ORANGE_COOKIES = [
         # Paste your cookies here in the same format
@@ -64,3 +124,47 @@ else:
     # Settings
     MAX_ERRORS = 10
     CHECK_INTERVAL = 5
+    TELEGRAM_WORKERS = 8
+    
+    # Hot reload: JSON file with ORANGE_COOKIES / settings, watched while running
+    # (edit it, or send SIGHUP to re-read config.py, without restarting)
+    RELOAD_FILE = './runtime.json'
+    
+    # Fast start: inject cookies via CDP before the first navigation
+    FAST_START = True
+    
+    # Persistent Chrome profile (warm restarts, suffixed with INSTANCE_ID when set) and optional tarball snapshot
+    CHROME_PROFILE_DIR = './chrome_profile'
+    CHROME_PROFILE_SNAPSHOT = ''
+    
+    # Redundant instances: shared claim store (memory://, sqlite:///path, file:///dir)
+    CLAIM_STORE = 'memory://'
+    CLAIM_TTL = 86400
+    CLAIM_LEASE = 600  # unfinished group posts are taken over after this
+    INSTANCE_ID = ''
+    
+    # Call history archive (empty path disables), retention in days (0 = forever)
+    ARCHIVE_DB = './calls.db'
+    ARCHIVE_BUCKET_SECONDS = 60
+    ARCHIVE_RETENTION_DAYS = 30
+    ARCHIVE_COUNTER_RETENTION_DAYS = 365
+    
+    # Answer /status, /active, /stats from admin chats
+    COMMANDS_ENABLED = True
+    
+    # Memory guards (R14): caps, eviction ages in seconds, Chrome memory limit in MB (0 = off)
+    MEMORY_CHECK_INTERVAL = 60
+    MEMORY_REPORT_INTERVAL = 900
+    TRACEMALLOC = False  # allocation tracing has a cost, enable only while hunting a leak
+    MAX_ACTIVE_CALLS = 500
+    STALE_CALL_SECONDS = 3600
+    PROCESSING_TIMEOUT = 600
+    BROWSER_RSS_LIMIT_MB = 0  # compared with Chrome's total PSS
+    MEMORY_REFRESH_COOLDOWN = 900
+    
+    # On-demand profiling (kill -USR1 <pid>): duration in seconds and output folder
+    PROFILE_SECONDS = 30
+    PROFILE_DIR = './profiles'
+    
+    # Extra call event outputs, comma-separated: jsonl:<path>, webhook:<url>, socket:<path|host:port>
+    OUTPUT_SINKS = ''
@@ -0,0 +1,83 @@
+"""
+Check parse_call_history() against the stub history page, or serve the stub.
+
+    python fixtures/check_call_history.py              # run the checks
+    python fixtures/check_call_history.py --serve 8000 # then HISTORY_URL=http://127.0.0.1:8000/call_history.html
+
+Exits with status 1 when the parsed calls differ from the expected ones.
+"""
+import os
+import sys
+import argparse
+import warnings
+from datetime import datetime
+from functools import partial
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+
+FIXTURE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(FIXTURE_DIR))
+warnings.filterwarnings("ignore")  # pydub warns when ffmpeg is missing
+
+import main
+
+EXPECTED = [
+    {
+        "call_uuid": "6f1c2a10-0b5e-4d7a-9a41-3c2e1f0a7b01",
+        "did_number": "8801712345678",
+        "call_time": datetime(2026, 1, 18, 14, 3, 22),
+        "duration": 47,
+    },
+    {
+        "call_uuid": "a9d3e5f7-1c2b-4e6d-8f90-1a2b3c4d5e6f",
+        "did_number": "447700900123",
+        "call_time": datetime(2026, 1, 18, 14, 5, 10),
+        "duration": 3725,
+    },
+    {
+        "call_uuid": "c4b1f8e2-7d6a-4c3b-9e8f-0a1b2c3d4e5f",
+        "did_number": "12025550147",
+        "call_time": datetime(2026, 1, 18, 14, 7),
+        "duration": None,
+    },
+    {
+        "call_uuid": "e0f1a2b3-c4d5-4e6f-8a9b-0c1d2e3f4a5b",
+        "did_number": "919876543210",
+        "call_time": None,
+        "duration": 12,
+    },
+]
+
+
+def check():
+    with open(os.path.join(FIXTURE_DIR, "call_history.html"), "r", encoding="utf-8") as f:
+        calls = main.parse_call_history(f.read())
+
+    failures = 0
+    parsed = {call["call_uuid"]: call for call in calls}
+    for expected in EXPECTED:
+        got = parsed.pop(expected["call_uuid"], None)
+        status = "ok" if got == expected else "FAIL"
+        failures += status == "FAIL"
+        print(f"{expected['call_uuid']}  {status}")
+        if got != expected:
+            print(f"    expected {expected}\n    got      {got}")
+    for call_uuid in parsed:
+        failures += 1
+        print(f"{call_uuid}  FAIL (unexpected row)")
+
+    return 1 if failures else 0
+
+
+def serve(port):
+    handler = partial(SimpleHTTPRequestHandler, directory=FIXTURE_DIR)
+    print(f"Serving http://127.0.0.1:{port}/call_history.html")
+    HTTPServer(("127.0.0.1", port), handler).serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--serve", type=int, metavar="PORT", help="serve the stub page instead of checking")
+    args = parser.parse_args()
+    if args.serve:
+        serve(args.serve)
+    sys.exit(check())
@@ -11,6 +11,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
 import phonenumbers
 from phonenumbers import region_code_for_number
 import pycountry
@@ -18,10 +19,88 @@ import config
 import speech_recognition as sr
 from pydub import AudioSegment
 import io
+import signal
+import importlib
+import tarfile
+import socket
+import threading
+import tracemalloc
+import claims
+import archive
+import profiler
+import sinks
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from html.parser import HTMLParser
+
+# Process start reference for time-to-first-scan reporting
+PROCESS_START = time.monotonic()
+PROCESS_START_TIME = datetime.now()
 
 active_calls = {}
-processing_calls = set()
+processing_calls = {}  # call_uuid -> processing start time
 refresh_pattern_index = 0
+reload_requested = False
+stop_requested = False
+profile_session = None
+RELOAD_FILE_MISSING = 'missing'
+reload_file_mtime = None  # None until the first check, then an mtime or RELOAD_FILE_MISSING
+startup_stats = {"time_to_first_scan": None, "warm_profile": False}
+
+# Shared claim store so redundant instances post each call only once
+INSTANCE_ID = config.INSTANCE_ID or f"{socket.gethostname()}-{os.getpid()}"
+claim_store = claims.MemoryClaimStore()
+handoff_calls = {}  # call_uuid -> (call_info, retry_at): group posts another instance claimed
+
+# Row fingerprinting: unchanged #LiveCalls tables skip the full parse
+last_fingerprint = None
+current_row_ids = set()
+last_parsed_at = None  # per-scan: when current_row_ids were last confirmed (full parse or unchanged fingerprint)
+scan_metrics = {
+    "scans": 0,
+    "skipped": 0,
+    "full_parses": 0,
+    "full_parse_wall": 0.0,
+    "full_parse_cpu": 0.0,
+    "full_parse_commands": 0,
+    "fingerprint_wall": 0.0,
+    "fingerprint_browser_ms": 0.0,
+    # Chrome main-thread time (CDP TaskDuration deltas) for sampled fingerprints / table reads
+    "fingerprint_task": 0.0,
+    "fingerprint_task_samples": 0,
+    "full_parse_task": 0.0,
+    "full_parse_task_samples": 0,
+}
+BROWSER_METRICS_EVERY = 10  # sample the fingerprint's browser cost every N scans
+
+# Extra output sinks for call events (opened in main() from OUTPUT_SINKS)
+event_sinks = []
+
+# Only one backfill of missed calls runs at a time
+backfill_lock = threading.Lock()
+
+# Call history archive (opened in main() when ARCHIVE_DB is set) and its
+# in-memory counters for the last day, read by /stats
+call_archive = None
+call_counts = None
+
+# Pipeline counters and the last published state snapshot (read by /status etc.)
+stats_lock = threading.Lock()
+pipeline_stats = {
+    "scans": 0,
+    "calls_detected": 0,
+    "calls_completed": 0,
+    "downloads_ok": 0,
+    "downloads_failed": 0,
+    "calls_backfilled": 0,
+}
+status_snapshot = {"taken_at": None, "active": [], "processing": 0, "stats": dict(pipeline_stats)}
+
+# Settings that can be swapped at runtime by a hot reload (name -> type)
+RELOADABLE_SETTINGS = {
+    'CHECK_INTERVAL': int,
+    'MAX_ERRORS': int,
+}
 
 # Updated refresh pattern as requested
 REFRESH_PATTERN = [1800, 1545, 2110, 1850, 1340]  # seconds
@@ -86,24 +165,53 @@ def detect_country(number):
         pass
     return "Unknown", "🏳️"
 
-def send_message_to_admin(text):
-    """Send message to Admin Telegram (Full number + URL only)"""
+def parse_chat_ids(value):
+    """Parse a comma-separated chat id list, e.g. "8574635657, 8365902294" """
+    return [chat_id.strip() for chat_id in str(value).split(',') if chat_id.strip()]
+
+# Telegram: admin chats parsed once, pooled connections, concurrent fan-out
+admin_chat_ids = parse_chat_ids(config.ADMIN_CHAT_ID)
+telegram_session = requests.Session()
+telegram_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=config.TELEGRAM_WORKERS))
+telegram_pool = ThreadPoolExecutor(max_workers=config.TELEGRAM_WORKERS, thread_name_prefix="telegram")
+
+def send_message_to_chat(chat_id, text, parse_mode="Markdown"):
+    """Send a message to one Telegram chat, returns its message id"""
     try:
         url = f"https://api.telegram.org/bot{config.BOT_TOKEN}/sendMessage"
-        payload = {"chat_id": config.ADMIN_CHAT_ID, "text": text, "parse_mode": "Markdown"}
-        res = requests.post(url, json=payload, timeout=10)
+        payload = {"chat_id": chat_id, "text": text, "parse_mode": parse_mode}
+        res = telegram_session.post(url, json=payload, timeout=10)
         if res.ok:
             return res.json().get("result", {}).get("message_id")
+        print(f"[DEBUG] Telegram response for {chat_id}: {res.status_code} - {res.text}")
     except Exception as e:
-        print(f"[❌] Failed to send message to admin: {e}")
+        print(f"[❌] Failed to send message to {chat_id}: {e}")
     return None
 
+def send_message_to_admin(text):
+    """Send message to every Admin Telegram chat concurrently (Full number + URL only)
+
+    Returns {chat_id: message_id} for the chats that received it.
+    """
+    chat_ids = admin_chat_ids
+    futures = {chat_id: telegram_pool.submit(send_message_to_chat, chat_id, text) for chat_id in chat_ids}
+    
+    msg_ids = {}
+    for chat_id, future in futures.items():
+        msg_id = future.result()
+        if msg_id:
+            msg_ids[chat_id] = msg_id
+    
+    if len(msg_ids) < len(chat_ids):
+        print(f"[⚠️] Admin message delivered to {len(msg_ids)}/{len(chat_ids)} chats")
+    return msg_ids
+
 def send_message_to_group(text):
     """Send message to Group Telegram"""
     try:
         url = f"https://api.telegram.org/bot{config.BOT_TOKEN}/sendMessage"
         payload = {"chat_id": config.GROUP_CHAT_ID, "text": text, "parse_mode": "HTML"}
-        res = requests.post(url, json=payload, timeout=10)
+        res = telegram_session.post(url, json=payload, timeout=10)
         if res.ok:
             return res.json().get("result", {}).get("message_id")
     except Exception as e:
@@ -114,10 +222,15 @@ def delete_message(chat_id, msg_id):
     """Delete message from Telegram"""
     try:
         url = f"https://api.telegram.org/bot{config.BOT_TOKEN}/deleteMessage"
-        requests.post(url, data={"chat_id": chat_id, "message_id": msg_id}, timeout=5)
+        telegram_session.post(url, data={"chat_id": chat_id, "message_id": msg_id}, timeout=5)
     except:
         pass
 
+def delete_admin_messages(msg_ids):
+    """Delete a call's admin messages in the background, all chats concurrently"""
+    for chat_id, msg_id in msg_ids.items():
+        telegram_pool.submit(delete_message, chat_id, msg_id)
+
 def send_voice_to_group(voice_path, caption):
     """Send voice recording with caption to Group Telegram"""
     try:
@@ -127,7 +240,7 @@ def send_voice_to_group(voice_path, caption):
         with open(voice_path, "rb") as voice:
             payload = {"chat_id": config.GROUP_CHAT_ID, "caption": caption, "parse_mode": "HTML"}
             files = {"voice": voice}
-            response = requests.post(url, data=payload, files=files, timeout=60)
+            response = telegram_session.post(url, data=payload, files=files, timeout=60)
             if response.status_code == 200:
                 return True
             else:
@@ -136,6 +249,36 @@ def send_voice_to_group(voice_path, caption):
         print(f"[❌] Failed to send voice to group: {e}")
     return False
 
+# Enhanced OTP pattern matching (tried in order)
+OTP_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'\b\d{4,6}\b',  # 4-6 digit OTP
+    r'code[\s\:\-]*(\d{4,6})',  # "code: 1234"
+    r'verification[\s\:\-]*(\d{4,6})',  # "verification 1234"
+    r'password[\s\:\-]*(\d{4,6})',  # "password 1234"
+    r'OTP[\s\:\-]*(\d{4,6})',  # "OTP 1234"
+    r'pin[\s\:\-]*(\d{4,6})',  # "pin 1234"
+    r'(\d{4,6})[\s]*is[\s]*your',  # "1234 is your"
+    r'your[\s]*code[\s]*is[\s]*(\d{4,6})',  # "your code is 1234"
+    r'código[\s\:\-]*(\d{4,6})',  # Spanish "código 1234"
+    r'verificación[\s\:\-]*(\d{4,6})',  # Spanish "verificación 1234"
+]]
+ANY_OTP_RE = re.compile(r'\b\d{4,6}\b')
+
+def find_otp_in_text(text):
+    """Find an OTP in a transcription using the pattern cascade"""
+    for pattern in OTP_PATTERNS:
+        matches = pattern.findall(text)
+        if matches:
+            otp = matches[0] if isinstance(matches[0], str) else matches[0][0] if matches[0] else None
+            if otp and otp.isdigit():
+                return otp
+    
+    # If no pattern matches, look for any 4-6 digit sequence
+    digit_matches = ANY_OTP_RE.findall(text)
+    if digit_matches:
+        return digit_matches[0]
+    return None
+
 def extract_otp_from_audio(audio_path):
     """Extract OTP from audio file (English + Spanish)"""
     try:
@@ -176,33 +319,10 @@ def extract_otp_from_audio(audio_path):
             print(f"[❌] Speech recognition error: {e}")
             return None
         
-        # Enhanced OTP pattern matching
-        otp_patterns = [
-            r'\b\d{4,6}\b',  # 4-6 digit OTP
-            r'code[\s\:\-]*(\d{4,6})',  # "code: 1234"
-            r'verification[\s\:\-]*(\d{4,6})',  # "verification 1234"
-            r'password[\s\:\-]*(\d{4,6})',  # "password 1234"
-            r'OTP[\s\:\-]*(\d{4,6})',  # "OTP 1234"
-            r'pin[\s\:\-]*(\d{4,6})',  # "pin 1234"
-            r'(\d{4,6})[\s]*is[\s]*your',  # "1234 is your"
-            r'your[\s]*code[\s]*is[\s]*(\d{4,6})',  # "your code is 1234"
-            r'código[\s\:\-]*(\d{4,6})',  # Spanish "código 1234"
-            r'verificación[\s\:\-]*(\d{4,6})',  # Spanish "verificación 1234"
-        ]
-        
-        for pattern in otp_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                otp = matches[0] if isinstance(matches[0], str) else matches[0][0] if matches[0] else None
-                if otp and otp.isdigit():
-                    print(f"[✅] OTP detected: {otp}")
-                    return otp
-        
-        # If no pattern matches, look for any 4-6 digit sequence
-        digit_matches = re.findall(r'\b\d{4,6}\b', text)
-        if digit_matches:
-            print(f"[🔢] Potential OTP found: {digit_matches[0]}")
-            return digit_matches[0]
+        otp = find_otp_in_text(text)
+        if otp:
+            print(f"[✅] OTP detected: {otp}")
+            return otp
         
         print(f"[❌] No OTP found in transcription: {text}")
         return None
@@ -216,6 +336,13 @@ def load_cookies_from_config():
     cookies_json = None
     
     try:
+        # Try the hot-reload file first (it can be updated while running)
+        reload_data = read_reload_file()
+        if reload_data and reload_data.get('ORANGE_COOKIES'):
+            cookies_json = reload_data['ORANGE_COOKIES']
+            print(f"[🍪] Loaded {len(cookies_json)} cookies from {config.RELOAD_FILE}")
+            return cookies_json
+
         # Try to get cookies from environment variable
         cookies_env = os.environ.get('ORANGE_COOKIES')
         if cookies_env:
@@ -318,10 +445,190 @@ def load_cookies_from_config():
         print(f"[❌] Error loading cookies: {e}")
         return []
 
-def setup_chrome_driver_with_cookies():
-    """Setup Chrome driver and load cookies for authentication"""
+def read_reload_file():
+    """Read cookies/settings from the hot-reload file (None if unavailable)"""
+    path = getattr(config, 'RELOAD_FILE', '')
+    if not path or not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+
+        # A bare list is treated as a cookie list
+        if isinstance(data, list):
+            data = {"ORANGE_COOKIES": data}
+        return data if isinstance(data, dict) else None
+    except Exception as e:
+        print(f"[❌] Error reading reload file {path}: {e}")
+        return None
+
+def prepare_cookie(cookie):
+    """Convert a browser-exported cookie into the format Selenium accepts"""
+    cookie_copy = cookie.copy()
+
+    # Convert expirationDate from double to integer if needed
+    if 'expirationDate' in cookie_copy:
+        cookie_copy['expiry'] = int(cookie_copy['expirationDate'])
+        del cookie_copy['expirationDate']
+
+    # Remove unsupported keys
+    unsupported_keys = ['hostOnly', 'storeId', 'sameSite']
+    for key in unsupported_keys:
+        if key in cookie_copy:
+            del cookie_copy[key]
+
+    return cookie_copy
+
+def apply_cookies(driver, cookies, verbose=False):
+    """Replace the driver's cookies with the given list, returns number added"""
+    driver.delete_all_cookies()
+
+    added = 0
+    for cookie in cookies:
+        try:
+            cookie_copy = prepare_cookie(cookie)
+            driver.add_cookie(cookie_copy)
+            added += 1
+            if verbose:
+                print(f"[✅] Added cookie: {cookie_copy.get('name')}")
+        except Exception as e:
+            if verbose:
+                print(f"[⚠️] Failed to add cookie {cookie.get('name')}: {e}")
+
+    return added
+
+def instance_profile_dir():
+    """CHROME_PROFILE_DIR, suffixed with INSTANCE_ID so redundant instances never share a profile"""
+    if not config.CHROME_PROFILE_DIR or not config.INSTANCE_ID:
+        return config.CHROME_PROFILE_DIR
+    safe_id = "".join(c if c.isalnum() or c in "-_." else "_" for c in config.INSTANCE_ID)
+    return f"{config.CHROME_PROFILE_DIR.rstrip('/')}-{safe_id}"
+
+# Persistent Chrome profile in use ('' = none, e.g. another Chrome holds it)
+chrome_profile_dir = instance_profile_dir()
+
+def profile_is_warm():
+    """Check whether the persistent Chrome profile already holds a session"""
+    if not chrome_profile_dir:
+        return False
+    return os.path.isdir(os.path.join(chrome_profile_dir, 'Default'))
+
+def profile_lock_owner(profile_dir):
+    """(host, pid) from Chrome's SingletonLock symlink, None if there is no lock"""
+    try:
+        target = os.readlink(os.path.join(profile_dir, 'SingletonLock'))
+    except OSError:
+        return None
+    host, _, pid = target.rpartition('-')
+    return host, int(pid) if pid.isdigit() else None
+
+def pid_alive(pid):
+    """Check whether a process with this pid exists on this host"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def prepare_profile_dir():
+    """Restore the profile snapshot if needed and clear stale Chrome locks
+
+    Locks are only removed when they belong to a dead Chrome on this host;
+    if the profile is in use (or locked from another host) this run goes
+    without a persistent profile instead of sharing it.
+    """
+    global chrome_profile_dir
+    
+    profile_dir = chrome_profile_dir
+    if not profile_dir:
+        return
+    
+    os.makedirs(profile_dir, exist_ok=True)
+    
+    owner = profile_lock_owner(profile_dir)
+    if owner is not None:
+        host, pid = owner
+        if host != socket.gethostname() or pid is None or pid_alive(pid):
+            print(f"[⚠️] Chrome profile {profile_dir} is locked by {host}-{pid}, starting without it")
+            chrome_profile_dir = ''
+            return
+    
+    snapshot = config.CHROME_PROFILE_SNAPSHOT
+    if snapshot and not profile_is_warm() and os.path.exists(snapshot):
+        try:
+            with tarfile.open(snapshot, 'r:gz') as tar:
+                if hasattr(tarfile, 'data_filter'):
+                    tar.extractall(profile_dir, filter='data')
+                else:
+                    tar.extractall(profile_dir)
+            print(f"[📦] Restored Chrome profile snapshot: {snapshot}")
+        except Exception as e:
+            print(f"[⚠️] Could not restore profile snapshot: {e}")
+    
+    # Locks left by a killed Chrome on this host make it refuse the profile
+    for name in ('SingletonLock', 'SingletonSocket', 'SingletonCookie'):
+        path = os.path.join(profile_dir, name)
+        if os.path.lexists(path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+def save_profile_snapshot():
+    """Save the (closed) Chrome profile as a tarball for the next boot"""
+    profile_dir = chrome_profile_dir
+    snapshot = config.CHROME_PROFILE_SNAPSHOT
+    if not profile_dir or not snapshot or not profile_is_warm():
+        return
+    
+    try:
+        tmp_path = snapshot + '.tmp'
+        with tarfile.open(tmp_path, 'w:gz') as tar:
+            for name in os.listdir(profile_dir):
+                if name.startswith('Singleton'):
+                    continue
+                tar.add(os.path.join(profile_dir, name), arcname=name)
+        os.replace(tmp_path, snapshot)
+        print(f"[📦] Saved Chrome profile snapshot: {snapshot}")
+    except Exception as e:
+        print(f"[⚠️] Could not save profile snapshot: {e}")
+
+def record_startup_time(seconds):
+    """Store time-to-first-scan in the profile and report the warm-start speed-up"""
+    if not chrome_profile_dir:
+        return
+    
+    kind = "warm" if startup_stats["warm_profile"] else "cold"
+    stats_path = os.path.join(chrome_profile_dir, 'startup_stats.json')
+    stats = {}
+    try:
+        with open(stats_path, 'r') as f:
+            stats = json.load(f)
+    except (OSError, ValueError):
+        pass
+    
+    stats[kind] = seconds
+    if kind == "warm" and stats.get("cold"):
+        speedup = stats["cold"] / seconds if seconds else 0
+        print(f"[⚡] Warm start {seconds:.2f}s vs last cold start {stats['cold']:.2f}s ({speedup:.1f}x faster)")
+    
+    try:
+        with open(stats_path, 'w') as f:
+            json.dump(stats, f)
+    except OSError as e:
+        print(f"[⚠️] Could not save startup stats: {e}")
+
+def create_chrome_driver():
+    """Create the Chrome driver with Heroku/local options"""
     chrome_options = Options()
     
+    # Persistent profile keeps session cookies and HTTP cache across restarts
+    if chrome_profile_dir:
+        chrome_options.add_argument(f'--user-data-dir={os.path.abspath(chrome_profile_dir)}')
+    
     # Heroku-specific settings
     is_heroku = os.environ.get('DYNO') is not None
     
@@ -356,52 +663,122 @@ def setup_chrome_driver_with_cookies():
         
         driver = webdriver.Chrome(options=chrome_options)
     
+    count_webdriver_commands(driver)
+    return driver
+
+# WebDriver commands sent by the current thread (see count_webdriver_commands)
+webdriver_commands = threading.local()
+
+def count_webdriver_commands(driver):
+    """Count every command the driver (and its elements) send, per thread"""
+    execute = driver.execute
+    
+    def counted_execute(driver_command, params=None):
+        webdriver_commands.count = getattr(webdriver_commands, 'count', 0) + 1
+        return execute(driver_command, params)
+    
+    driver.execute = counted_execute
+
+def to_cdp_cookie(cookie):
+    """Convert a browser-exported cookie into a CDP Network.CookieParam"""
+    cdp_cookie = {
+        "name": cookie['name'],
+        "value": cookie['value'],
+        "path": cookie.get('path', '/'),
+        "secure": bool(cookie.get('secure', False)),
+        "httpOnly": bool(cookie.get('httpOnly', False)),
+    }
+    
+    # Host-only cookies are set by URL so Chrome doesn't widen them to subdomains
+    domain = cookie.get('domain', 'www.orangecarrier.com')
+    if cookie.get('hostOnly'):
+        cdp_cookie['url'] = f"https://{domain.lstrip('.')}{cdp_cookie['path']}"
+    else:
+        cdp_cookie['domain'] = domain
+    
+    expiry = cookie.get('expirationDate', cookie.get('expiry'))
+    if expiry and not cookie.get('session'):
+        cdp_cookie['expires'] = float(expiry)
+    
+    same_site = {'lax': 'Lax', 'strict': 'Strict', 'none': 'None', 'no_restriction': 'None'}
+    if str(cookie.get('sameSite', '')).lower() in same_site:
+        cdp_cookie['sameSite'] = same_site[str(cookie['sameSite']).lower()]
+    
+    return cdp_cookie
+
+def inject_cookies_cdp(driver, cookies):
+    """Set all cookies in one CDP call (works before the first navigation)"""
+    try:
+        driver.execute_cdp_cmd('Network.setCookies', {
+            "cookies": [to_cdp_cookie(cookie) for cookie in cookies]
+        })
+        print(f"[🍪] Injected {len(cookies)} cookies via CDP")
+        return True
+    except Exception as e:
+        print(f"[⚠️] CDP cookie injection failed: {e}")
+        return False
+
+def wait_for_page_ready(driver, timeout=15):
+    """Wait until the current document has finished loading"""
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+        return True
+    except:
+        return False
+
+def wait_for_calls_or_login(driver, timeout=20):
+    """Wait until either the LiveCalls table shows up or we land on the login page.
+
+    Returns True when the LiveCalls table is present.
+    """
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda d: "login" in d.current_url or d.find_elements(By.ID, "LiveCalls")
+        )
+    except:
+        return False
+    return "login" not in driver.current_url and bool(driver.find_elements(By.ID, "LiveCalls"))
+
+def setup_chrome_driver_with_cookies():
+    """Setup Chrome driver and load cookies for authentication"""
+    prepare_profile_dir()
+    warm = profile_is_warm()
+    
+    driver = create_chrome_driver()
+    driver.set_page_load_timeout(60)
+    
+    # Warm profile: try the stored session first, cookies are the fallback
+    if warm:
+        print(f"[♨️] Reusing Chrome profile: {chrome_profile_dir}")
+        startup_stats["warm_profile"] = True
+        return driver
+    
     # Load cookies
     cookies = load_cookies_from_config()
     
     if cookies:
+        # Fast start: bulk-inject before the first navigation
+        if config.FAST_START and inject_cookies_cdp(driver, cookies):
+            return driver
+        
         try:
             # First navigate to domain to set cookies
-            driver.get("https://www.orangecarrier.com")
-            time.sleep(2)
-            
-            # Delete existing cookies
-            driver.delete_all_cookies()
-            time.sleep(1)
+            driver.get(config.BASE_URL)
+            wait_for_page_ready(driver)
             
-            # Add new cookies
-            for cookie in cookies:
-                try:
-                    # Remove unwanted keys that Selenium doesn't support
-                    cookie_copy = cookie.copy()
-                    
-                    # Convert expirationDate from double to integer if needed
-                    if 'expirationDate' in cookie_copy:
-                        cookie_copy['expiry'] = int(cookie_copy['expirationDate'])
-                        del cookie_copy['expirationDate']
-                    
-                    # Remove unsupported keys
-                    unsupported_keys = ['hostOnly', 'storeId', 'sameSite']
-                    for key in unsupported_keys:
-                        if key in cookie_copy:
-                            del cookie_copy[key]
-                    
-                    # Add cookie to driver
-                    driver.add_cookie(cookie_copy)
-                    print(f"[✅] Added cookie: {cookie_copy.get('name')}")
-                    
-                except Exception as e:
-                    print(f"[⚠️] Failed to add cookie {cookie.get('name')}: {e}")
+            # Replace existing cookies with the configured ones
+            apply_cookies(driver, cookies, verbose=True)
             
             # Refresh to apply cookies
             driver.refresh()
-            time.sleep(3)
+            wait_for_page_ready(driver)
             print(f"[🍪] Successfully loaded {len(cookies)} cookies")
             
         except Exception as e:
             print(f"[❌] Error setting cookies: {e}")
     
-    driver.set_page_load_timeout(60)
     return driver
 
 def login_with_cookies(driver):
@@ -409,57 +786,213 @@ def login_with_cookies(driver):
     try:
         print("[🔐] Attempting login with cookies...")
         
-        # Navigate to login page first
-        driver.get(config.LOGIN_URL)
-        time.sleep(3)
-        
-        # Check if we're already logged in
-        current_url = driver.current_url
-        if "dashboard" in current_url or "live/calls" in current_url:
-            print("[✅] Already logged in via cookies!")
-            return True
-        
-        # If not logged in, try to access calls page directly
+        # Go straight to the calls page; a dead session redirects to login
         driver.get(config.CALL_URL)
-        time.sleep(3)
+        if wait_for_calls_or_login(driver):
+            print("[✅] Login successful with cookies!")
+            return True
         
         # Check for login page redirect
         if "login" in driver.current_url:
             print("[❌] Cookies expired or invalid")
             return False
         
-        # Check for LiveCalls table
-        try:
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.ID, "LiveCalls"))
-            )
-            print("[✅] Login successful with cookies!")
+        # Try alternative method - check for any dashboard element
+        page_source = driver.page_source
+        if "Dashboard" in page_source or "Live Calls" in page_source:
+            print("[✅] Login successful (alternative check)!")
             return True
-        except:
-            # Try alternative method - check for any dashboard element
-            page_source = driver.page_source
-            if "Dashboard" in page_source or "Live Calls" in page_source:
-                print("[✅] Login successful (alternative check)!")
-                return True
-            
-            print("[❌] Could not verify login status")
-            return False
+        
+        print("[❌] Could not verify login status")
+        return False
             
     except Exception as e:
         print(f"[💥] Cookie login error: {e}")
         return False
 
+def emit_call_event(event_type, call_info, **extra):
+    """Fan a call event out to every output sink (never blocks)"""
+    if not event_sinks:
+        return
+    
+    event = {
+        "type": event_type,
+        "call_uuid": call_info["call_uuid"],
+        "did_number": call_info["did_number"],
+        "country": call_info["country"],
+        "flag": call_info["flag"],
+        "detected_at": call_info["detected_at"].isoformat(),
+        "instance": INSTANCE_ID,
+    }
+    if call_info.get("completed_at"):
+        event["completed_at"] = call_info["completed_at"].isoformat()
+    event.update(extra)
+    
+    for sink in event_sinks:
+        sink.emit(event)
+
+def bump_stat(name, amount=1):
+    """Increment a pipeline counter"""
+    with stats_lock:
+        pipeline_stats[name] = pipeline_stats.get(name, 0) + amount
+
+def publish_snapshot():
+    """Publish a read-only copy of the monitor state for the command thread"""
+    global status_snapshot
+    
+    with stats_lock:
+        stats = dict(pipeline_stats)
+    
+    status_snapshot = {
+        "taken_at": datetime.now(),
+        "active": [
+            (info["flag"], info["country"], info["did_number"], info["detected_at"])
+            for info in list(active_calls.values())
+        ],
+        "processing": len(processing_calls),
+        "stats": stats,
+    }
+
+def diff_calls(active, current_rows, processing):
+    """Split a scan into (new call ids, completed call ids)
+
+    New calls are rows not tracked yet; completed calls are tracked calls
+    whose row disappeared and that are not already being processed.
+    """
+    new_calls = [row_id for row_id in current_rows if row_id not in active]
+    completed_calls = [
+        call_id for call_id in active
+        if call_id not in current_rows and call_id not in processing
+    ]
+    return new_calls, completed_calls
+
+# FNV-1a over "<row id>:<DID digits>;" for the rows extract_calls would parse
+FINGERPRINT_SCRIPT = """
+const table = document.getElementById('LiveCalls');
+if (!table) return null;
+const start = performance.now();
+let hash = 2166136261, count = 0;
+for (const row of table.getElementsByTagName('tr')) {
+    if (!row.id) continue;
+    const cells = row.getElementsByTagName('td');
+    if (cells.length < 5) continue;
+    const did = cells[1].textContent.replace(/\\D/g, '');
+    if (!did) continue;
+    const key = row.id + ':' + did + ';';
+    for (let i = 0; i < key.length; i++) {
+        hash = Math.imul(hash ^ key.charCodeAt(i), 16777619) >>> 0;
+    }
+    count++;
+}
+return [hash, count, performance.now() - start];
+"""
+
+def browser_task_seconds(driver):
+    """Chrome's cumulative main-thread TaskDuration in seconds (CDP), None if unavailable
+
+    The value includes any page script that ran meanwhile, so deltas are an
+    upper bound for the work our own commands caused.
+    """
+    commands_before = getattr(webdriver_commands, 'count', 0)
+    try:
+        metrics = driver.execute_cdp_cmd('Performance.getMetrics', {})['metrics']
+        task = next((m['value'] for m in metrics if m['name'] == 'TaskDuration'), None)
+        if task is None:
+            # Metrics are only collected once the Performance domain is enabled
+            driver.execute_cdp_cmd('Performance.enable', {})
+        return task
+    except Exception:
+        return None
+    finally:
+        # Measuring is not part of the scan's own command count
+        webdriver_commands.count = commands_before
+
+def table_fingerprint(driver, sample=False):
+    """Cheap in-page fingerprint of the LiveCalls rows, None if unavailable"""
+    task_before = browser_task_seconds(driver) if sample else None
+    started = time.perf_counter()
+    try:
+        result = driver.execute_script(FINGERPRINT_SCRIPT)
+    except Exception:
+        return None
+    scan_metrics["fingerprint_wall"] += time.perf_counter() - started
+    task_after = browser_task_seconds(driver) if task_before is not None else None
+    if task_after is not None:
+        scan_metrics["fingerprint_task"] += task_after - task_before
+        scan_metrics["fingerprint_task_samples"] += 1
+    if not result:
+        return None
+    scan_metrics["fingerprint_browser_ms"] += result[2]
+    return (result[0], result[1])
+
+def call_last_seen(call_id, info):
+    """When a tracked call's row was last seen in the table"""
+    if call_id in current_row_ids and last_parsed_at:
+        return max(last_parsed_at, info["last_seen"])
+    return info["last_seen"]
+
+def report_scan_metrics():
+    """Print how many scans the fingerprint skipped and the work it saved"""
+    m = scan_metrics
+    if not m["scans"]:
+        return
+    
+    parses = m["full_parses"] or 1
+    checks = m["scans"]
+    print("[🧮] Scan metrics")
+    print(f"    skipped {m['skipped']}/{m['scans']} scans ({m['skipped'] / m['scans']:.1%})")
+    print(f"    python: full parse {m['full_parse_cpu'] / parses * 1000:.1f} ms CPU, "
+          f"saved ~{m['full_parse_cpu'] / parses * m['skipped'] * 1000:.0f} ms CPU")
+    print(f"    webdriver: full parse {m['full_parse_commands'] / parses:.0f} commands "
+          f"({m['full_parse_wall'] / parses * 1000:.0f} ms), fingerprint 1 command "
+          f"({m['fingerprint_wall'] / checks * 1000:.1f} ms), "
+          f"~{m['full_parse_commands'] / parses * m['skipped']:.0f} commands avoided")
+    
+    # Browser main-thread time: every skipped scan saves a table read but pays for a fingerprint
+    if m["full_parse_task_samples"] and m["fingerprint_task_samples"]:
+        parse_ms = m["full_parse_task"] / m["full_parse_task_samples"] * 1000
+        fingerprint_ms = m["fingerprint_task"] / m["fingerprint_task_samples"] * 1000
+        saved_ms = m["skipped"] * parse_ms - checks * fingerprint_ms
+        print(f"    browser: table read {parse_ms:.2f} ms, fingerprint {fingerprint_ms:.2f} ms "
+              f"({m['fingerprint_browser_ms'] / checks:.2f} ms script) main-thread time, "
+              f"saved ~{saved_ms:.0f} ms")
+    else:
+        print(f"    browser: fingerprint {m['fingerprint_browser_ms'] / checks:.2f} ms script in page "
+              "(no CDP metrics, browser time saved unknown)")
+
 def extract_calls(driver):
-    """Extract call information from the calls table"""
-    global active_calls, processing_calls
+    """Extract call information from the calls table
+
+    Returns True when the table was read (an unchanged fingerprint counts),
+    False when it could not be read and calls may have been missed.
+    """
+    global active_calls, processing_calls, last_fingerprint, current_row_ids, last_parsed_at
+    
+    scan_metrics["scans"] += 1
+    scan_time = datetime.now()
+    
+    # Same rows as the last full parse: nothing new, nothing completed
+    fingerprint = table_fingerprint(driver, sample=scan_metrics["scans"] % BROWSER_METRICS_EVERY == 1)
+    if fingerprint is not None and fingerprint == last_fingerprint:
+        scan_metrics["skipped"] += 1
+        last_parsed_at = scan_time
+        return True
+    
+    scan_ok = False
+    parse_started = time.perf_counter()
+    # Own-thread CPU and commands only: download/Telegram/sink threads run meanwhile
+    parse_cpu_started = time.thread_time()
+    parse_commands_started = getattr(webdriver_commands, 'count', 0)
+    row_errors = 0
     
     try:
+        task_before = browser_task_seconds(driver)
         calls_table = WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.ID, "LiveCalls"))
         )
         
         rows = calls_table.find_elements(By.TAG_NAME, "tr")
-        current_call_ids = set()
+        current_rows = {}
         
         for row in rows:
             try:
@@ -478,61 +1011,93 @@ def extract_calls(driver):
                 if not did_number:
                     continue
                 
-                current_call_ids.add(row_id)
-                
-                if row_id not in active_calls:
-                    print(f"[📞] New call detected: {did_number}")
-                    
-                    country_name, flag = detect_country(did_number)
-                    
-                    # Build full URL
-                    full_url = f"https://www.orangecarrier.com/live/calls/sound?did={did_number}&uuid={row_id}"
-                    
-                    # Send to ADMIN only (Full number + URL) - NO POST CONTENT
-                    admin_text = f"📞 {did_number}\n🔗 {full_url}"
-                    
-                    msg_id = send_message_to_admin(admin_text)
-                    active_calls[row_id] = {
-                        "admin_msg_id": msg_id,
-                        "flag": flag,
-                        "country": country_name,
-                        "did_number": did_number,
-                        "call_uuid": row_id,
-                        "detected_at": datetime.now(),
-                        "last_seen": datetime.now(),
-                        "full_url": full_url
-                    }
-                else:
-                    active_calls[row_id]["last_seen"] = datetime.now()
+                current_rows[row_id] = did_number
                     
             except StaleElementReferenceException:
+                row_errors += 1
                 continue
             except Exception as e:
+                row_errors += 1
                 print(f"[❌] Row processing error: {e}")
                 continue
         
-        current_time = datetime.now()
-        completed_calls = []
+        task_after = browser_task_seconds(driver) if task_before is not None else None
+        if task_after is not None:
+            scan_metrics["full_parse_task"] += task_after - task_before
+            scan_metrics["full_parse_task_samples"] += 1
+        
+        current_time = scan_time
+        new_calls, completed_calls = diff_calls(active_calls, current_rows, processing_calls)
+        
+        # Rows on the page, protected from stale-entry eviction
+        # Tracked rows that just left the page were last seen at the previous parse
+        for row_id in current_row_ids - current_rows.keys():
+            if row_id in active_calls and last_parsed_at:
+                active_calls[row_id]["last_seen"] = last_parsed_at
+        current_row_ids = set(current_rows)
+        last_parsed_at = scan_time
+        
+        # Only trust the fingerprint if every row was parsed
+        last_fingerprint = fingerprint if not row_errors else None
+        
+        for row_id in new_calls:
+            did_number = current_rows[row_id]
+            print(f"[📞] New call detected: {did_number}")
+            bump_stat("calls_detected")
+            
+            country_name, flag = detect_country(did_number)
+            
+            # Build full URL
+            full_url = f"https://www.orangecarrier.com/live/calls/sound?did={did_number}&uuid={row_id}"
+            
+            # Send to ADMIN only (Full number + URL) - NO POST CONTENT
+            admin_text = f"📞 {did_number}\n🔗 {full_url}"
+            
+            # First instance to see the call announces it
+            msg_ids = {}
+            announced = claim_store.claim(f"{row_id}:admin", INSTANCE_ID)
+            if announced:
+                msg_ids = send_message_to_admin(admin_text)
+            else:
+                print(f"[🤝] Call {row_id} already announced by another instance")
+            active_calls[row_id] = {
+                "admin_msg_ids": msg_ids,
+                "flag": flag,
+                "country": country_name,
+                "did_number": did_number,
+                "call_uuid": row_id,
+                "detected_at": datetime.now(),
+                "last_seen": scan_time,
+                "full_url": full_url
+            }
+            if announced:
+                emit_call_event("call_detected", active_calls[row_id])
         
-        # Find completed calls
-        for call_id, call_info in list(active_calls.items()):
-            if (call_id not in current_call_ids) and (call_id not in processing_calls):
-                print(f"[✅] Call completed: {call_info['did_number']}")
-                completed_calls.append(call_id)
+        for call_id in completed_calls:
+            print(f"[✅] Call completed: {active_calls[call_id]['did_number']}")
+            bump_stat("calls_completed")
         
         # Process completed calls immediately
         for call_id in completed_calls:
             call_info = active_calls[call_id]
             
+            call_info["completed_at"] = current_time
+            
             # Mark as processing to avoid duplicate processing
-            processing_calls.add(call_id)
+            processing_calls[call_id] = current_time
             
             # Delete the admin monitoring message
-            if call_info["admin_msg_id"]:
-                delete_message(config.ADMIN_CHAT_ID, call_info["admin_msg_id"])
+            delete_admin_messages(call_info["admin_msg_ids"])
+            
+            # Another instance already handles the group post; take over if its lease expires
+            if not claim_store.claim(f"{call_id}:group", INSTANCE_ID, config.CLAIM_LEASE):
+                print(f"[🤝] Call {call_id} already posted by another instance")
+                handoff_calls[call_id] = (call_info, time.time() + config.CLAIM_LEASE)
+                processing_calls.pop(call_id, None)
+                del active_calls[call_id]
+                continue
             
             # Start recording process in a separate thread to avoid blocking
-            import threading
             thread = threading.Thread(
                 target=process_completed_call,
                 args=(driver, call_info, call_id)
@@ -542,11 +1107,21 @@ def extract_calls(driver):
             
             # Remove from active calls
             del active_calls[call_id]
+        
+        scan_ok = True
                 
     except TimeoutException:
+        last_fingerprint = None
         print("[⏱️] No active calls table found")
     except Exception as e:
+        last_fingerprint = None
         print(f"[❌] Error extracting calls: {e}")
+    
+    scan_metrics["full_parses"] += 1
+    scan_metrics["full_parse_wall"] += time.perf_counter() - parse_started
+    scan_metrics["full_parse_cpu"] += time.thread_time() - parse_cpu_started
+    scan_metrics["full_parse_commands"] += getattr(webdriver_commands, 'count', 0) - parse_commands_started
+    return scan_ok
 
 def process_completed_call(driver, call_info, call_uuid):
     """Process completed call - download voice and extract OTP"""
@@ -554,59 +1129,137 @@ def process_completed_call(driver, call_info, call_uuid):
         print(f"[🎙️] Processing completed call: {call_info['did_number']}")
         
         # Create unique filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        file_path = os.path.join(DOWNLOAD_FOLDER, f"call_{call_info['did_number']}_{timestamp}.mp3")
+        file_path = recording_path(call_info)
         
         # Try to download the voice recording
-        if download_voice_recording(driver, call_info, call_uuid, file_path):
-            # Send to GROUP with voice (OTP removed)
-            send_to_group_with_voice(call_info, file_path)
-        else:
-            # If download fails, send failure message to group
-            send_download_failed_to_group(call_info)
+        download_ok = download_voice_recording(driver, call_info, call_uuid, file_path)
+        finish_call(call_info, file_path, download_ok)
         
-        # Clean up processing set
-        if call_uuid in processing_calls:
-            processing_calls.remove(call_uuid)
+        # Clean up processing entry
+        processing_calls.pop(call_uuid, None)
             
     except Exception as e:
         print(f"[💥] Call processing error: {e}")
-        if call_uuid in processing_calls:
-            processing_calls.remove(call_uuid)
+        processing_calls.pop(call_uuid, None)
+        # Let another instance (or a backfill) post it
+        release_group_claim(call_uuid)
 
-def download_voice_recording(driver, call_info, call_uuid, file_path):
-    """Download voice recording using direct download method"""
+def release_group_claim(call_uuid):
+    """Give up this instance's group post claim after a failure"""
     try:
-        print("[🔄] Trying enhanced direct download...")
-        
-        # Simulate play button first
-        play_script = f'window.Play("{call_info["did_number"]}", "{call_uuid}"); return true;'
-        driver.execute_script(play_script)
-        time.sleep(5)
-        
-        # Get all cookies and session data
-        cookies = driver.get_cookies()
-        session = requests.Session()
-        
-        for cookie in cookies:
-            session.cookies.set(cookie['name'], cookie['value'])
-        
-        # Enhanced headers
-        headers = {
-            'User-Agent': driver.execute_script("return navigator.userAgent;"),
-            'Accept': 'audio/mpeg, audio/*, */*',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Referer': config.CALL_URL,
-            'Origin': 'https://www.orangecarrier.com',
-            'Sec-Fetch-Dest': 'audio',
-            'Sec-Fetch-Mode': 'no-cors',
-            'Sec-Fetch-Site': 'same-origin',
-            'X-Requested-With': 'XMLHttpRequest'
-        }
-        
-        # Use the full URL we already built
-        recording_url = call_info['full_url']
+        claim_store.release(f"{call_uuid}:group", INSTANCE_ID)
+    except Exception as e:
+        print(f"[⚠️] Could not release claim for {call_uuid}: {e}")
+
+def take_over_handoffs(driver):
+    """Post calls whose claiming instance let the group lease expire unfinished"""
+    now = time.time()
+    for call_id, (call_info, retry_at) in list(handoff_calls.items()):
+        if now < retry_at:
+            continue
+        
+        key = f"{call_id}:group"
+        try:
+            if claim_store.is_done(key):
+                del handoff_calls[call_id]
+                continue
+            if not claim_store.claim(key, INSTANCE_ID, config.CLAIM_LEASE):
+                handoff_calls[call_id] = (call_info, now + config.CLAIM_LEASE)
+                continue
+        except Exception as e:
+            print(f"[⚠️] Claim check failed for {call_id}: {e}")
+            continue
         
+        del handoff_calls[call_id]
+        print(f"[🤝] Taking over call {call_info['did_number']}, the other instance did not finish it")
+        processing_calls[call_id] = datetime.now()
+        threading.Thread(target=process_completed_call, args=(driver, call_info, call_id), daemon=True).start()
+
+def recording_path(call_info):
+    """Unique download path for a call's recording"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return os.path.join(DOWNLOAD_FOLDER, f"call_{call_info['did_number']}_{timestamp}.mp3")
+
+def finish_call(call_info, file_path, download_ok):
+    """Post a finished call to the group and record the outcome"""
+    if download_ok:
+        # Send to GROUP with voice (OTP removed)
+        send_to_group_with_voice(call_info, file_path)
+    else:
+        # If download fails, send failure message to group
+        send_download_failed_to_group(call_info)
+    
+    bump_stat("downloads_ok" if download_ok else "downloads_failed")
+    try:
+        claim_store.finish(f"{call_info['call_uuid']}:group", INSTANCE_ID)
+    except Exception as e:
+        print(f"[⚠️] Could not mark claim done for {call_info['call_uuid']}: {e}")
+    archive_call(call_info, download_ok)
+    emit_call_event(
+        "call_completed",
+        call_info,
+        download_ok=bool(download_ok),
+        backfilled=call_info.get("backfilled", False)
+    )
+
+def archive_call(call_info, download_ok):
+    """Append a finished call to the call archive"""
+    if call_archive is None:
+        return
+    
+    try:
+        completed_at = call_info.get('completed_at') or datetime.now()
+        call_counts.record(
+            call_info['did_number'],
+            call_info['country'],
+            call_info['flag'],
+            call_info['detected_at'].timestamp(),
+            download_ok
+        )
+        call_archive.record(
+            call_info['call_uuid'],
+            call_info['did_number'],
+            call_info['country'],
+            call_info['flag'],
+            call_info['detected_at'].timestamp(),
+            completed_at.timestamp(),
+            download_ok
+        )
+    except Exception as e:
+        print(f"[❌] Failed to archive call {call_info.get('call_uuid')}: {e}")
+
+def compact_archive():
+    """Apply archive retention (runs in a background thread)"""
+    try:
+        removed = call_archive.compact(config.ARCHIVE_RETENTION_DAYS, config.ARCHIVE_COUNTER_RETENTION_DAYS)
+        if removed:
+            print(f"[🗄️] Archive compaction removed {removed} rows")
+    except Exception as e:
+        print(f"[⚠️] Archive compaction failed: {e}")
+
+def build_download_session(driver):
+    """Copy the browser's cookies and user agent into a requests session"""
+    session = requests.Session()
+    for cookie in driver.get_cookies():
+        session.cookies.set(cookie['name'], cookie['value'])
+    
+    # Enhanced headers
+    headers = {
+        'User-Agent': driver.execute_script("return navigator.userAgent;"),
+        'Accept': 'audio/mpeg, audio/*, */*',
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Referer': config.CALL_URL,
+        'Origin': 'https://www.orangecarrier.com',
+        'Sec-Fetch-Dest': 'audio',
+        'Sec-Fetch-Mode': 'no-cors',
+        'Sec-Fetch-Site': 'same-origin',
+        'X-Requested-With': 'XMLHttpRequest'
+    }
+    return session, headers
+
+def download_recording(session, headers, recording_url, file_path):
+    """Stream a recording to file_path, returns True if a real file arrived"""
+    try:
         response = session.get(recording_url, headers=headers, timeout=30, stream=True)
         
         if response.status_code == 200:
@@ -627,41 +1280,58 @@ def download_voice_recording(driver, call_info, call_uuid, file_path):
         print(f"[❌] Voice download error: {e}")
         return False
 
+def download_voice_recording(driver, call_info, call_uuid, file_path):
+    """Download voice recording using direct download method"""
+    try:
+        print("[🔄] Trying enhanced direct download...")
+        
+        # Simulate play button first
+        play_script = f'window.Play("{call_info["did_number"]}", "{call_uuid}"); return true;'
+        driver.execute_script(play_script)
+        time.sleep(5)
+        
+        # Get all cookies and session data
+        session, headers = build_download_session(driver)
+        
+        # Use the full URL we already built
+        return download_recording(session, headers, call_info['full_url'], file_path)
+        
+    except Exception as e:
+        print(f"[❌] Voice download error: {e}")
+        return False
+
+def mask_number(number):
+    """Mask the phone number in format: 8559****473"""
+    if len(number) >= 8:
+        # Show first 4 digits, then 4 asterisks, then last 3 digits
+        return number[:4] + "****" + number[-3:]
+    # Fallback for shorter numbers
+    return number[:4] + "****" + number[4:]
+
+def build_group_caption(call_info, title, extra_lines=()):
+    """Build the group caption: title, time, country and masked number"""
+    call_time = call_info['detected_at'].strftime('%Y-%m-%d %I:%M:%S %p')
+    caption = (
+        f"{title}\n\n"
+        f"└ ⏰ Time: {call_time}\n"
+        f"└ {call_info['flag']} {call_info['country']}\n"
+        f"└ 📞 Number: {mask_number(call_info['did_number'])}\n"
+    )
+    for line in extra_lines:
+        caption += f"└ {line}\n"
+    return caption
+
 def send_to_group_with_voice(call_info, file_path):
     """Send voice recording to group with masked number format (OTP removed)"""
     try:
-        call_time = call_info['detected_at'].strftime('%Y-%m-%d %I:%M:%S %p')
-        
-        # Mask the phone number in format: 8559****473
-        number = call_info['did_number']
-        if len(number) >= 8:
-            # Show first 4 digits, then 4 asterisks, then last 3 digits
-            masked_number = number[:4] + "****" + number[-3:]
-        else:
-            # Fallback for shorter numbers
-            masked_number = number[:4] + "****" + number[4:]
-        
-        # Build caption in the requested format
-        caption = (
-            "📳 New Call Captured!\n\n"
-            f"└ ⏰ Time: {call_time}\n"
-            f"└ {call_info['flag']} {call_info['country']}\n"
-            f"└ 📞 Number: {masked_number}\n"
-        )
+        caption = build_group_caption(call_info, "📳 New Call Captured!")
         
         # Send voice to group
         if send_voice_to_group(file_path, caption):
             print(f"[✅] Voice sent to group successfully: {call_info['did_number']}")
         else:
             # Fallback with text message in same format
-            text_fallback = (
-                "📳 New Call Captured!\n\n"
-                f"└ ⏰ Time: {call_time}\n"
-                f"└ {call_info['flag']} {call_info['country']}\n"
-                f"└ 📞 Number: {masked_number}\n"
-            )
-            
-            send_message_to_group(text_fallback)
+            send_message_to_group(caption)
             
         # Clean up file
         try:
@@ -675,23 +1345,10 @@ def send_to_group_with_voice(call_info, file_path):
 def send_download_failed_to_group(call_info):
     """Send download failure message to group in masked number format"""
     try:
-        call_time = call_info['detected_at'].strftime('%Y-%m-%d %I:%M:%S %p')
-        
-        # Mask the phone number in format: 8559****473
-        number = call_info['did_number']
-        if len(number) >= 8:
-            # Show first 4 digits, then 4 asterisks, then last 3 digits
-            masked_number = number[:4] + "****" + number[-3:]
-        else:
-            # Fallback for shorter numbers
-            masked_number = number[:4] + "****" + number[4:]
-        
-        failure_text = (
-            "😟 Please contact group admin for error call OTP\n\n"
-            f"└ ⏰ Time: {call_time}\n"
-            f"└ {call_info['flag']} {call_info['country']}\n"
-            f"└ 📞 Number: {masked_number}\n"
-            f"└ ❌ Voice download failed\n"
+        failure_text = build_group_caption(
+            call_info,
+            "😟 Please contact group admin for error call OTP",
+            ["❌ Voice download failed"]
         )
         
         send_message_to_group(failure_text)
@@ -700,6 +1357,237 @@ def send_download_failed_to_group(call_info):
     except Exception as e:
         print(f"[❌] Error sending failure message: {e}")
 
+# Play buttons on the history page: Play("<did>", "<uuid>")
+PLAY_CALL_RE = re.compile(r'Play\(\s*["\'](\d+)["\']\s*,\s*["\']([\w-]+)["\']')
+
+# Call time and duration cells on the history page
+HISTORY_TIME_RE = re.compile(
+    r'(\d{4}[-/]\d{1,2}[-/]\d{1,2}|\d{1,2}[-/]\d{1,2}[-/]\d{4})[ T](\d{1,2}:\d{2}(?::\d{2})?(?:\s*[AaPp][Mm])?)'
+)
+HISTORY_DURATION_RE = re.compile(r'^(?:(\d+):)?(\d{1,2}):(\d{2})$|^(\d+)\s*s(?:ec)?$')
+HISTORY_TIME_FORMATS = [
+    f"{date_format} {time_format}"
+    for date_format in ("%Y-%m-%d", "%d-%m-%Y")
+    for time_format in ("%H:%M:%S", "%H:%M", "%I:%M:%S %p", "%I:%M %p")
+]
+
+def parse_history_time(text):
+    """Parse a date-time in a history cell (e.g. 2026-01-18 14:03:22), None if there is none"""
+    match = HISTORY_TIME_RE.search(text)
+    if not match:
+        return None
+    date_part = match.group(1).replace('/', '-')
+    time_part = re.sub(r'\s*([AaPp][Mm])$', lambda m: ' ' + m.group(1).upper(), match.group(2))
+    for time_format in HISTORY_TIME_FORMATS:
+        try:
+            return datetime.strptime(f"{date_part} {time_part}", time_format)
+        except ValueError:
+            continue
+    return None
+
+def parse_history_duration(text):
+    """Parse a duration cell (1:23, 0:01:23 or 83s) into seconds, None if it isn't one"""
+    match = HISTORY_DURATION_RE.match(text.strip())
+    if not match:
+        return None
+    if match.group(4):
+        return int(match.group(4))
+    return int(match.group(1) or 0) * 3600 + int(match.group(2)) * 60 + int(match.group(3))
+
+class CallHistoryParser(HTMLParser):
+    """Collect calls (uuid, DID, call time, duration) from a call history / CDR page"""
+    
+    def __init__(self):
+        super().__init__()
+        self.calls = {}
+        self._in_row = False
+        self._row_id = None
+        self._play = None
+        self._cells = []
+        self._in_cell = False
+    
+    def _add(self, call_uuid, did_number, call_time=None, duration=None):
+        self.calls.setdefault(call_uuid, {"did_number": did_number, "call_time": call_time, "duration": duration})
+    
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'tr':
+            self._in_row = True
+            self._row_id = attrs.get('id')
+            self._play = None
+            self._cells = []
+        elif tag == 'td' and self._in_row:
+            self._in_cell = True
+            self._cells.append('')
+        
+        match = PLAY_CALL_RE.search(attrs.get('onclick') or '')
+        if match:
+            if self._in_row:
+                self._play = self._play or (match.group(2), match.group(1))
+            else:
+                self._add(match.group(2), match.group(1))
+    
+    def handle_endtag(self, tag):
+        if tag == 'td':
+            self._in_cell = False
+        elif tag == 'tr' and self._in_row:
+            self._in_row = False
+            
+            # Play(did, uuid) wins; otherwise the LiveCalls layout: row id + DID in the second cell
+            if self._play:
+                call_uuid, did_number = self._play
+            elif self._row_id and len(self._cells) >= 2:
+                call_uuid, did_number = self._row_id, re.sub(r"\D", "", self._cells[1])
+            else:
+                return
+            if not did_number:
+                return
+            
+            call_time = duration = None
+            for cell in self._cells:
+                if call_time is None:
+                    call_time = parse_history_time(cell)
+                if duration is None:
+                    duration = parse_history_duration(cell)
+            self._add(call_uuid, did_number, call_time, duration)
+    
+    def handle_data(self, data):
+        if self._in_cell:
+            self._cells[-1] += data
+
+def parse_call_history(html):
+    """Parse a call history page into [{"call_uuid", "did_number", "call_time", "duration"}]
+
+    call_time is the time shown on the page (None if the row has none),
+    duration is in seconds (None if the row has no duration cell).
+    """
+    parser = CallHistoryParser()
+    parser.feed(html)
+    return [{"call_uuid": call_uuid, **call} for call_uuid, call in parser.calls.items()]
+
+# The saved scan time may lag by this much; the archive / claims dedup the overlap
+SCAN_STATE_SAVE_INTERVAL = 30  # seconds
+
+def load_last_scan_time():
+    """Last successful scan time saved by this or a previous run, None if unknown"""
+    if not config.BACKFILL_STATE_FILE:
+        return None
+    try:
+        with open(config.BACKFILL_STATE_FILE, 'r') as f:
+            return datetime.fromtimestamp(json.load(f)["last_scan"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def save_last_scan_time(scan_time):
+    """Persist the last successful scan time so a restart only backfills the gap"""
+    if not config.BACKFILL_STATE_FILE:
+        return
+    tmp_path = config.BACKFILL_STATE_FILE + '.tmp'
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump({"last_scan": scan_time.timestamp()}, f)
+        os.replace(tmp_path, config.BACKFILL_STATE_FILE)
+    except OSError as e:
+        print(f"[⚠️] Could not save last scan time: {e}")
+
+def call_already_handled(call_uuid):
+    """Check whether a call is live, in progress, archived or posted by any instance"""
+    if call_uuid in active_calls or call_uuid in processing_calls:
+        return True
+    if call_archive is not None and call_archive.has_call(call_uuid):
+        return True
+    return False
+
+def process_backfilled_call(session, headers, call_info):
+    """Download and post a call that completed while we were not watching"""
+    call_uuid = call_info['call_uuid']
+    try:
+        print(f"[⏪] Backfilling missed call: {call_info['did_number']}")
+        file_path = recording_path(call_info)
+        download_ok = download_recording(session, headers, call_info['full_url'], file_path)
+        finish_call(call_info, file_path, download_ok)
+    except Exception as e:
+        print(f"[💥] Backfill processing error: {e}")
+        release_group_claim(call_uuid)
+    finally:
+        processing_calls.pop(call_uuid, None)
+
+def run_backfill(session, headers, since):
+    """Fetch recent call history in bulk and queue every call newer than since that was missed"""
+    try:
+        res = session.get(config.HISTORY_URL, headers={'User-Agent': headers['User-Agent']}, timeout=30)
+        if not res.ok:
+            print(f"[⚠️] Backfill: history page returned {res.status_code}")
+            return
+        
+        history = parse_call_history(res.text)
+        now = datetime.now()
+        offset = timedelta(minutes=config.HISTORY_TIME_OFFSET_MINUTES)
+        missed = []
+        undated = 0
+        for entry in history:
+            call_uuid = entry['call_uuid']
+            
+            # Only calls from the gap: anything older was seen (or posted) already
+            if entry['call_time'] is None:
+                undated += 1
+                continue
+            call_time = entry['call_time'] - offset
+            if call_time <= since or call_already_handled(call_uuid):
+                continue
+            
+            # Skip calls any instance (this one included) already posted
+            claim_key = f"{call_uuid}:group"
+            if claim_store.is_claimed(claim_key) or not claim_store.claim(claim_key, INSTANCE_ID, config.CLAIM_LEASE):
+                continue
+            
+            country_name, flag = detect_country(entry['did_number'])
+            missed.append({
+                "admin_msg_ids": {},
+                "flag": flag,
+                "country": country_name,
+                "did_number": entry['did_number'],
+                "call_uuid": call_uuid,
+                "detected_at": call_time,
+                "last_seen": call_time,
+                "completed_at": call_time + timedelta(seconds=entry['duration'] or 0),
+                "full_url": f"https://www.orangecarrier.com/live/calls/sound?did={entry['did_number']}&uuid={call_uuid}",
+                "backfilled": True
+            })
+            processing_calls[call_uuid] = now
+        
+        print(f"[⏪] Backfill since {since.strftime('%Y-%m-%d %H:%M:%S')}: "
+              f"{len(history)} calls in history, {len(missed)} missed"
+              + (f", {undated} without a call time skipped" if undated else ""))
+        bump_stat("calls_backfilled", len(missed))
+        
+        # Bounded concurrency through the normal download/upload path
+        with ThreadPoolExecutor(max_workers=config.BACKFILL_CONCURRENCY, thread_name_prefix="backfill") as pool:
+            for call_info in missed:
+                pool.submit(process_backfilled_call, session, headers, call_info)
+    except Exception as e:
+        print(f"[❌] Backfill error: {e}")
+    finally:
+        backfill_lock.release()
+
+def start_backfill(driver, reason, since):
+    """Start a backfill of calls newer than since in the background (skipped if one is already running)"""
+    if not config.HISTORY_URL or not backfill_lock.acquire(blocking=False):
+        return
+    
+    # Never reach further back than BACKFILL_MAX_AGE, however old the last scan is
+    since = max(since, datetime.now() - timedelta(seconds=config.BACKFILL_MAX_AGE))
+    
+    try:
+        session, headers = build_download_session(driver)
+    except Exception as e:
+        backfill_lock.release()
+        print(f"[⚠️] Backfill skipped, could not read browser session: {e}")
+        return
+    
+    print(f"[⏪] Starting backfill ({reason})")
+    threading.Thread(target=run_backfill, args=(session, headers, since), daemon=True).start()
+
 def check_login_status(driver):
     """Check if user is still logged in"""
     try:
@@ -740,7 +1628,7 @@ def refresh_with_cookies(driver):
     try:
         print("[🔄] Refreshing page...")
         driver.refresh()
-        time.sleep(5)
+        wait_for_page_ready(driver)
         
         # Check if we got logged out
         if not check_login_status(driver):
@@ -748,25 +1636,10 @@ def refresh_with_cookies(driver):
             # Re-apply cookies
             cookies = load_cookies_from_config()
             if cookies:
-                driver.delete_all_cookies()
-                for cookie in cookies:
-                    try:
-                        cookie_copy = cookie.copy()
-                        if 'expirationDate' in cookie_copy:
-                            cookie_copy['expiry'] = int(cookie_copy['expirationDate'])
-                            del cookie_copy['expirationDate']
-                        
-                        unsupported_keys = ['hostOnly', 'storeId', 'sameSite']
-                        for key in unsupported_keys:
-                            if key in cookie_copy:
-                                del cookie_copy[key]
-                        
-                        driver.add_cookie(cookie_copy)
-                    except:
-                        continue
+                apply_cookies(driver, cookies)
                 
                 driver.refresh()
-                time.sleep(5)
+                wait_for_page_ready(driver)
         
         return True
         
@@ -774,22 +1647,428 @@ def refresh_with_cookies(driver):
         print(f"[❌] Refresh error: {e}")
         return False
 
+def is_admin_chat(chat_id):
+    """Check whether a chat id is one of the configured admin chats"""
+    return str(chat_id) in admin_chat_ids
+
+def format_age(since):
+    """Format the time elapsed since a datetime as e.g. 3m 20s"""
+    seconds = int((datetime.now() - since).total_seconds())
+    if seconds >= 3600:
+        return f"{seconds // 3600}h {seconds % 3600 // 60}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m {seconds % 60}s"
+    return f"{seconds}s"
+
+def build_command_reply(command):
+    """Build the reply to a bot command from the published snapshot only"""
+    snapshot = status_snapshot
+    stats = snapshot["stats"]
+    
+    if command == "/status":
+        last_scan = format_age(snapshot["taken_at"]) + " ago" if snapshot["taken_at"] else "never"
+        first_scan = startup_stats["time_to_first_scan"]
+        return (
+            "🟢 Monitor status\n\n"
+            f"└ Instance: {INSTANCE_ID}\n"
+            f"└ Uptime: {format_age(PROCESS_START_TIME)}\n"
+            f"└ Last scan: {last_scan}\n"
+            f"└ First scan after: {f'{first_scan:.1f}s' if first_scan else '-'}\n"
+            f"└ Active calls: {len(snapshot['active'])}\n"
+            f"└ Processing: {snapshot['processing']}\n"
+            f"└ Scans: {stats['scans']} ({scan_metrics['skipped']} unchanged, skipped)\n"
+            f"└ Detected / completed: {stats['calls_detected']} / {stats['calls_completed']}\n"
+            f"└ Downloads ok / failed: {stats['downloads_ok']} / {stats['downloads_failed']}"
+        )
+    
+    if command == "/active":
+        if not snapshot["active"]:
+            return "📭 No active calls"
+        lines = [f"📞 Active calls ({len(snapshot['active'])})\n"]
+        for flag, country, did_number, detected_at in snapshot["active"][:30]:
+            lines.append(f"└ {flag} {did_number} ({country}) - {format_age(detected_at)}")
+        return "\n".join(lines)
+    
+    if command == "/stats":
+        if call_counts is None:
+            return (
+                "📊 Stats (since start)\n\n"
+                f"└ Completed calls: {stats['calls_completed']}\n"
+                f"└ Downloads ok / failed: {stats['downloads_ok']} / {stats['downloads_failed']}"
+            )
+        calls_hour, ok_hour = call_counts.totals(3600)
+        calls_day, ok_day = call_counts.totals(86400)
+        lines = [
+            "📊 Stats\n",
+            f"└ Last hour: {calls_hour} calls ({ok_hour} recorded)",
+            f"└ Last 24h: {calls_day} calls ({ok_day} recorded)",
+            "\n🌍 Countries (last hour)",
+        ]
+        for country, flag, total in call_counts.calls_per_country(3600):
+            lines.append(f"└ {flag} {country}: {total}")
+        lines.append("\n🔢 Top prefixes (last 24h)")
+        for prefix, total in call_counts.top_prefixes(86400):
+            lines.append(f"└ {prefix}…: {total}")
+        return "\n".join(lines)
+    
+    return "Commands: /status, /active, /stats"
+
+def drain_pending_updates(session, url):
+    """Confirm every pending update without answering it, returns the next offset"""
+    res = session.get(f"{url}/getUpdates", params={"offset": -1, "timeout": 0}, timeout=10)
+    if res.status_code == 409:
+        # Another poller owns the updates, nothing to drain here
+        return None
+    res.raise_for_status()
+    updates = res.json().get("result", [])
+    if not updates:
+        return None
+    return updates[-1]["update_id"] + 1
+
+def command_listener():
+    """Long-poll getUpdates and answer bot commands (own thread, never touches the driver)"""
+    session = requests.Session()
+    url = f"https://api.telegram.org/bot{config.BOT_TOKEN}"
+    offset = None
+    drained = False
+    
+    while True:
+        try:
+            # Skip commands that queued up while the bot was down
+            if not drained:
+                offset = drain_pending_updates(session, url)
+                drained = True
+            
+            res = session.get(
+                f"{url}/getUpdates",
+                params={"offset": offset, "timeout": 25, "allowed_updates": '["message"]'},
+                timeout=35
+            )
+            if res.status_code == 409:
+                # Another poller (webhook or redundant instance) owns the updates
+                time.sleep(60)
+                continue
+            if not res.ok:
+                time.sleep(5)
+                continue
+            
+            for update in res.json().get("result", []):
+                offset = update["update_id"] + 1
+                message = update.get("message") or {}
+                text = (message.get("text") or "").strip()
+                chat_id = message.get("chat", {}).get("id")
+                
+                if not text.startswith("/") or not is_admin_chat(chat_id):
+                    continue
+                
+                command = text.split()[0].split("@")[0].lower()
+                session.post(
+                    f"{url}/sendMessage",
+                    json={"chat_id": chat_id, "text": build_command_reply(command)},
+                    timeout=10
+                )
+        except Exception as e:
+            print(f"[⚠️] Command listener error: {e}")
+            time.sleep(5)
+
+def chrome_pss_mb(driver):
+    """Total PSS (MB) of chromedriver and all its child processes (Linux only)
+
+    PSS splits shared pages between the processes mapping them, so unlike
+    summed RSS the total is not inflated by Chrome's shared memory.
+    """
+    try:
+        root_pid = driver.service.process.pid
+    except Exception:
+        return None
+    
+    # Build the parent -> children map from /proc
+    children = {}
+    try:
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry}/stat', 'r') as f:
+                    stat = f.read()
+                ppid = int(stat.rsplit(')', 1)[1].split()[1])
+                children.setdefault(ppid, []).append(int(entry))
+            except (OSError, ValueError, IndexError):
+                continue
+    except OSError:
+        return None
+    
+    total_kb = 0
+    measured = False
+    pending = [root_pid]
+    while pending:
+        pid = pending.pop()
+        pending.extend(children.get(pid, []))
+        try:
+            with open(f'/proc/{pid}/smaps_rollup', 'r') as f:
+                for line in f:
+                    if line.startswith('Pss:'):
+                        total_kb += int(line.split()[1])
+                        measured = True
+                        break
+        except (OSError, ValueError):
+            continue
+    
+    return total_kb / 1024 if measured else None
+
+def evict_stale_entries():
+    """Drop active/processing entries that can no longer complete normally
+
+    A call's row counts as seen at last_parsed_at while it is in
+    current_row_ids. Rows on a recently read page are never evicted (the
+    next full parse would announce them again); they only go stale when
+    the table itself has not been read for STALE_CALL_SECONDS.
+    """
+    global last_fingerprint
+    
+    now = datetime.now()
+    
+    # Active calls not seen for too long (e.g. table failed to load)
+    stale = [
+        call_id for call_id, info in list(active_calls.items())
+        if (now - call_last_seen(call_id, info)).total_seconds() > config.STALE_CALL_SECONDS
+    ]
+    
+    # Hard cap: evict the least recently seen entries that are off the page
+    overflow = len(active_calls) - len(stale) - config.MAX_ACTIVE_CALLS
+    if overflow > 0:
+        remaining = sorted(
+            (info["last_seen"], call_id) for call_id, info in list(active_calls.items())
+            if call_id not in stale and call_id not in current_row_ids
+        )
+        stale.extend(call_id for _, call_id in remaining[:overflow])
+    
+    for call_id in stale:
+        info = active_calls.pop(call_id, None)
+        if info:
+            delete_admin_messages(info["admin_msg_ids"])
+    
+    # Rows evicted with an outdated page: re-track them (and re-announce) on the next full parse
+    if current_row_ids.intersection(stale):
+        last_fingerprint = None
+    
+    # Processing entries whose worker thread died before cleanup
+    dead = [
+        call_id for call_id, started in list(processing_calls.items())
+        if (now - started).total_seconds() > config.PROCESSING_TIMEOUT
+    ]
+    for call_id in dead:
+        processing_calls.pop(call_id, None)
+    
+    # Hand-offs that never settled (claim pruned, store unreachable, ...)
+    for call_id, (call_info, _) in list(handoff_calls.items()):
+        if (now - call_info["completed_at"]).total_seconds() > config.STALE_CALL_SECONDS:
+            del handoff_calls[call_id]
+    
+    if stale or dead:
+        print(f"[🧹] Evicted {len(stale)} stale active calls, {len(dead)} stuck processing entries")
+
+def report_memory(driver):
+    """Print Python allocation hot spots, state sizes and browser PSS"""
+    pss = chrome_pss_mb(driver)
+    print("[🧠] Memory report")
+    print(f"    active_calls={len(active_calls)} processing_calls={len(processing_calls)} handoff_calls={len(handoff_calls)}")
+    print(f"    chrome_pss={f'{pss:.0f} MB' if pss is not None else 'n/a'}")
+    
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        print(f"    python_traced={current / 1048576:.1f} MB (peak {peak / 1048576:.1f} MB)")
+        for stat in tracemalloc.take_snapshot().statistics('lineno')[:5]:
+            print(f"    {stat}")
+
+def handle_profile_signal(signum, frame):
+    """Signal handler: profile the running monitor for PROFILE_SECONDS"""
+    global profile_session
+    if profile_session is None:
+        profile_session = profiler.ProfileSession(config.PROFILE_SECONDS, config.PROFILE_DIR)
+        profile_session.start()
+
+def handle_stop_signal(signum, frame):
+    """Signal handler: leave the monitor loop so main() closes the browser and sinks"""
+    global stop_requested
+    if stop_requested:
+        return
+    stop_requested = True
+    print(f"\n[🛑] Received signal {signum}, shutting down...")
+    raise SystemExit(0)
+
+def handle_reload_signal(signum, frame):
+    """Signal handler: ask the monitor loop to hot-reload cookies/settings"""
+    global reload_requested
+    reload_requested = True
+
+def reload_file_changed():
+    """Check whether the hot-reload file was modified since the last check"""
+    global reload_file_mtime
+
+    path = getattr(config, 'RELOAD_FILE', '')
+    if not path:
+        return False
+
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        mtime = RELOAD_FILE_MISSING
+
+    # First check only records the baseline (a missing file is a baseline too)
+    if reload_file_mtime is None:
+        reload_file_mtime = mtime
+        return False
+
+    if mtime != reload_file_mtime:
+        reload_file_mtime = mtime
+        # Creating or editing the file reloads, deleting it does not
+        return mtime != RELOAD_FILE_MISSING
+    return False
+
+def verify_session(driver, timeout=15):
+    """Check that the driver is logged in and the LiveCalls table loads"""
+    try:
+        if not check_login_status(driver):
+            return False
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.ID, "LiveCalls"))
+        )
+        return True
+    except:
+        return False
+
+def hot_reload(driver):
+    """Re-read cookies/settings and apply them to the running driver.
+
+    The session is verified with the new cookies before the new settings
+    are committed; on failure the previous cookies and config are restored.
+    """
+    global admin_chat_ids
+    
+    print("[♻️] Hot reload: re-reading cookies and settings...")
+
+    old_settings = {k: v for k, v in vars(config).items() if k.isupper()}
+    try:
+        old_cookies = driver.get_cookies()
+    except Exception as e:
+        print(f"[❌] Hot reload aborted, could not read current cookies: {e}")
+        return False
+
+    # Pick up edits to config.py
+    try:
+        importlib.reload(config)
+    except Exception as e:
+        print(f"[⚠️] Could not reload config.py, keeping current values: {e}")
+
+    # Collect new runtime settings (reload file overrides config.py)
+    new_settings = {}
+    reload_data = read_reload_file() or {}
+    for name, cast in RELOADABLE_SETTINGS.items():
+        value = reload_data.get(name, getattr(config, name, old_settings.get(name)))
+        try:
+            new_settings[name] = cast(value)
+        except (TypeError, ValueError):
+            print(f"[⚠️] Invalid value for {name}: {value!r}, keeping {old_settings.get(name)!r}")
+            new_settings[name] = old_settings.get(name)
+
+    cookies = load_cookies_from_config()
+    if not cookies:
+        print("[❌] Hot reload aborted, no cookies available")
+        for name, value in old_settings.items():
+            setattr(config, name, value)
+        return False
+
+    try:
+        apply_cookies(driver, cookies)
+        driver.get(config.CALL_URL)
+        session_ok = verify_session(driver)
+    except Exception as e:
+        print(f"[❌] Hot reload error: {e}")
+        session_ok = False
+
+    if not session_ok:
+        print("[❌] New cookies did not verify, restoring previous session")
+        try:
+            apply_cookies(driver, old_cookies)
+            driver.get(config.CALL_URL)
+        except Exception as e:
+            print(f"[❌] Failed to restore previous cookies: {e}")
+        for name, value in old_settings.items():
+            setattr(config, name, value)
+        return False
+
+    for name, value in new_settings.items():
+        setattr(config, name, value)
+    admin_chat_ids = parse_chat_ids(config.ADMIN_CHAT_ID)
+
+    changed = [f"{k}={v}" for k, v in new_settings.items() if old_settings.get(k) != v]
+    print(f"[✅] Hot reload applied: {len(cookies)} cookies" + (f", {', '.join(changed)}" if changed else ""))
+    return True
+
 def main():
+    global reload_requested, claim_store, call_archive, call_counts, profile_session, event_sinks
+
     print("[🚀] Starting Orange Carrier Monitor with Cookies...")
     
+    # SIGHUP triggers a hot reload of cookies/settings
+    if hasattr(signal, 'SIGHUP'):
+        signal.signal(signal.SIGHUP, handle_reload_signal)
+    
+    # SIGUSR1 starts an on-demand profile of the running monitor
+    if hasattr(signal, 'SIGUSR1'):
+        signal.signal(signal.SIGUSR1, handle_profile_signal)
+    
+    # SIGTERM (Heroku restarts, docker stop) runs the same cleanup as Ctrl+C
+    signal.signal(signal.SIGTERM, handle_stop_signal)
+    
     driver = None
     try:
+        claim_store = claims.open_claim_store(config.CLAIM_STORE)
+        print(f"[🤝] Instance {INSTANCE_ID} using claim store: {config.CLAIM_STORE}")
+        
+        if config.ARCHIVE_DB:
+            call_archive = archive.CallArchive(config.ARCHIVE_DB, config.ARCHIVE_BUCKET_SECONDS)
+            call_counts = archive.RollingCounts(config.ARCHIVE_BUCKET_SECONDS)
+            call_counts.load(call_archive.recent_counts(call_counts.window))
+            print(f"[🗄️] Call archive: {config.ARCHIVE_DB}")
+        
+        for spec in config.OUTPUT_SINKS.split(','):
+            if spec.strip():
+                try:
+                    event_sinks.append(sinks.open_sink(spec))
+                    print(f"[📤] Output sink: {spec.strip()}")
+                except Exception as e:
+                    print(f"[⚠️] Could not open output sink {spec.strip()}: {e}")
+        
+        if config.TRACEMALLOC:
+            tracemalloc.start()
+        
+        # Bot commands are answered from snapshots on their own thread
+        if config.COMMANDS_ENABLED:
+            threading.Thread(target=command_listener, daemon=True).start()
+        
         # Setup Chrome driver with cookies
         driver = setup_chrome_driver_with_cookies()
         
         # Login with cookies
-        if not login_with_cookies(driver):
+        logged_in = login_with_cookies(driver)
+        
+        # Stored profile session was invalid, fall back to configured cookies
+        if not logged_in and startup_stats["warm_profile"]:
+            print("[⚠️] Stored profile session invalid, loading cookies from config...")
+            cookies = load_cookies_from_config()
+            if cookies and not inject_cookies_cdp(driver, cookies):
+                driver.get(config.BASE_URL)
+                apply_cookies(driver, cookies)
+            logged_in = login_with_cookies(driver)
+        
+        if not logged_in:
             print("[❌] Cookie login failed, attempting manual login...")
             
             # Fallback to manual login
             print("[👤] Please login manually in the browser...")
             driver.get(config.LOGIN_URL)
-            time.sleep(5)
             
             # Wait for manual login
             login_wait = 300  # 5 minutes
@@ -807,10 +2086,10 @@ def main():
                 print("[❌] Manual login timeout")
                 return
         
-        # Navigate to calls page
-        print(f"[📞] Opening calls page: {config.CALL_URL}")
-        driver.get(config.CALL_URL)
-        time.sleep(10)
+        # Navigate to calls page (login_with_cookies already left us there)
+        if "live/calls" not in driver.current_url:
+            print(f"[📞] Opening calls page: {config.CALL_URL}")
+            driver.get(config.CALL_URL)
         
         # Wait for LiveCalls table
         try:
@@ -834,14 +2113,72 @@ def main():
         error_count = 0
         last_refresh = datetime.now()
         next_refresh_interval = get_next_refresh_time()
-        
-        while error_count < config.MAX_ERRORS:
+        last_memory_check = datetime.now()
+        last_memory_report = datetime.now()
+        last_memory_refresh = None
+        force_refresh = False
+        last_scan_at = time.monotonic()
+        # Without a saved scan time only calls since this process started count as missed
+        last_scan_time = load_last_scan_time() or PROCESS_START_TIME
+        last_state_save = 0.0
+        backfill_reason = "startup"
+        reload_file_changed()  # record the reload file baseline
+        
+        while error_count < config.MAX_ERRORS and not stop_requested:
             try:
-                # Dynamic refresh based on the specified pattern
+                # Finish a SIGUSR1 profile once its time is up (a failure drops the session)
+                if profile_session is not None:
+                    done = True
+                    try:
+                        done = profile_session.poll()
+                    except Exception as e:
+                        print(f"[❌] Profiling failed: {e}")
+                    finally:
+                        if done:
+                            profile_session = None
+                
+                # Hot reload on SIGHUP or when the reload file changes
+                if reload_requested or reload_file_changed():
+                    reload_requested = False
+                    if hot_reload(driver):
+                        backfill_reason = "after hot reload"
+                
                 current_time = datetime.now()
-                if (current_time - last_refresh).total_seconds() > next_refresh_interval:
+                
+                # Leak guards: evict stale entries, refresh early (at most once per cooldown) if Chrome grows too big
+                if (current_time - last_memory_check).total_seconds() > config.MEMORY_CHECK_INTERVAL:
+                    last_memory_check = current_time
+                    evict_stale_entries()
+                    pss = chrome_pss_mb(driver) if config.BROWSER_RSS_LIMIT_MB else None
+                    cooled_down = (
+                        last_memory_refresh is None
+                        or (current_time - last_memory_refresh).total_seconds() > config.MEMORY_REFRESH_COOLDOWN
+                    )
+                    if pss and pss > config.BROWSER_RSS_LIMIT_MB and cooled_down:
+                        print(f"[🧠] Chrome PSS {pss:.0f} MB > {config.BROWSER_RSS_LIMIT_MB} MB, refreshing early")
+                        last_memory_refresh = current_time
+                        force_refresh = True
+                
+                if config.MEMORY_REPORT_INTERVAL and (current_time - last_memory_report).total_seconds() > config.MEMORY_REPORT_INTERVAL:
+                    last_memory_report = current_time
+                    report_memory(driver)
+                    report_scan_metrics()
+                
+                # Dynamic refresh based on the specified pattern
+                if force_refresh or (current_time - last_refresh).total_seconds() > next_refresh_interval:
+                    force_refresh = False
                     print(f"[🔄] Scheduled refresh triggered after {next_refresh_interval} seconds")
                     
+                    # Drop old claims so the shared store stays small
+                    try:
+                        claim_store.prune(config.CLAIM_TTL)
+                    except Exception as e:
+                        print(f"[⚠️] Claim prune failed: {e}")
+                    
+                    if call_archive is not None:
+                        threading.Thread(target=compact_archive, daemon=True).start()
+                    
+                    backfill_reason = "after refresh"
                     if refresh_with_cookies(driver):
                         # Wait for LiveCalls table
                         try:
@@ -867,9 +2204,37 @@ def main():
                         error_count += 1
                         time.sleep(10)
                         continue
+                    backfill_reason = "after re-login"
+                
+                # A long gap between scans means calls may have been missed
+                if time.monotonic() - last_scan_at > config.BACKFILL_GAP_SECONDS:
+                    backfill_reason = f"{time.monotonic() - last_scan_at:.0f}s scan gap"
                 
                 # Extract calls
-                extract_calls(driver)
+                scan_started = datetime.now()
+                scan_ok = extract_calls(driver)
+                take_over_handoffs(driver)
+                bump_stat("scans")
+                publish_snapshot()
+                
+                # Only a successful scan closes a gap; failed ones keep it open for the backfill
+                if scan_ok:
+                    backfill_since = last_scan_time
+                    last_scan_at = time.monotonic()
+                    last_scan_time = scan_started
+                    if time.monotonic() - last_state_save >= SCAN_STATE_SAVE_INTERVAL:
+                        save_last_scan_time(last_scan_time)
+                        last_state_save = time.monotonic()
+                    
+                    # Backfill after the scan so calls still live are already tracked
+                    if backfill_reason:
+                        start_backfill(driver, backfill_reason, backfill_since)
+                        backfill_reason = None
+                    
+                    if startup_stats["time_to_first_scan"] is None:
+                        startup_stats["time_to_first_scan"] = time.monotonic() - PROCESS_START
+                        print(f"[⏱️] Time to first scan: {startup_stats['time_to_first_scan']:.2f}s")
+                        record_startup_time(startup_stats["time_to_first_scan"])
                 
                 error_count = 0
                 time.sleep(config.CHECK_INTERVAL)
@@ -888,6 +2253,11 @@ def main():
         if driver:
             print("[👋] Closing browser...")
             driver.quit()
+            save_profile_snapshot()
+        
+        # Flush queued events before exiting
+        for sink in event_sinks:
+            sink.close()
     
     print("[*] Monitoring stopped")
 
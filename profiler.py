@@ -0,0 +1,105 @@
+"""
+On-demand profiling of the live monitor.
+
+A ProfileSession runs cProfile on the thread that starts it (the monitor
+loop) and a stack sampler over every thread (download workers, command
+listener, ...) for a fixed number of seconds, then writes:
+
+    profile_<time>.pstats   cProfile data (python -m pstats / snakeviz)
+    profile_<time>.folded   sampled stacks in folded format (flamegraph.pl / speedscope)
+
+Time spent waiting on chromedriver is tagged with a [webdriver] frame in the
+folded stacks and reported separately. Nothing runs until a session starts.
+"""
+import os
+import sys
+import time
+import pstats
+import cProfile
+import threading
+from datetime import datetime
+
+WEBDRIVER_MARKER = os.path.join("selenium", "webdriver", "remote")
+
+
+class ProfileSession:
+    """cProfile on the calling thread plus a sampler over all threads"""
+
+    def __init__(self, duration, output_dir, interval=0.005):
+        self.duration = duration
+        self.output_dir = output_dir
+        self.interval = interval
+        self.samples = {}
+        self.total_samples = 0
+        self.webdriver_samples = 0
+        self.rounds = 0
+        self.started = None
+        self.deadline = None
+        self._profile = cProfile.Profile()
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(target=self._sample, name="profiler", daemon=True)
+
+    def start(self):
+        print(f"[🔬] Profiling for {self.duration}s...")
+        self.started = time.monotonic()
+        self.deadline = self.started + self.duration
+        self._sampler.start()
+        self._profile.enable()
+
+    def poll(self):
+        """Stop and write the profile once the duration is over, returns True when done"""
+        if time.monotonic() < self.deadline:
+            return False
+        self.stop()
+        return True
+
+    def stop(self):
+        self._profile.disable()
+        self._stop.set()
+        self._sampler.join()
+
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            base = os.path.join(self.output_dir, f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+            self._profile.dump_stats(base + ".pstats")
+            with open(base + ".folded", "w") as f:
+                for stack, count in sorted(self.samples.items(), key=lambda item: -item[1]):
+                    f.write(f"{stack} {count}\n")
+            print(f"[🔬] Profile written: {base}.pstats / {base}.folded")
+        except OSError as e:
+            print(f"[❌] Could not write profile to {self.output_dir}: {e}")
+
+        # Each sampling round covers elapsed / rounds seconds of wall time per thread
+        seconds_per_round = (time.monotonic() - self.started) / self.rounds if self.rounds else 0
+        share = self.webdriver_samples / self.total_samples * 100 if self.total_samples else 0
+        print(f"[🔬] WebDriver round-trips: ~{self.webdriver_samples * seconds_per_round:.2f}s thread time "
+              f"({self.webdriver_samples}/{self.total_samples} samples, {share:.1f}%)")
+        pstats.Stats(self._profile).sort_stats("cumulative").print_stats(10)
+
+    def _sample(self):
+        own_ident = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self.rounds += 1
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+
+                stack = []
+                in_webdriver = False
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                    if WEBDRIVER_MARKER in code.co_filename:
+                        in_webdriver = True
+                    frame = frame.f_back
+
+                stack.append(names.get(ident, str(ident)))
+                stack.reverse()
+                if in_webdriver:
+                    stack.append("[webdriver]")
+                    self.webdriver_samples += 1
+
+                key = ";".join(stack)
+                self.samples[key] = self.samples.get(key, 0) + 1
+                self.total_samples += 1
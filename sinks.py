@@ -0,0 +1,160 @@
+"""
+Output sinks for call events besides Telegram.
+
+Every sink owns a bounded queue and a writer thread. emit() never blocks:
+when a sink falls behind, its oldest queued events are dropped (and counted)
+so a slow consumer can't slow down the scan loop or the Telegram path.
+The writer sends events in batches and retries failed batches with
+exponential backoff. Sinks are configured as "kind:target" specs:
+
+    jsonl:/tmp/calls.jsonl                append one JSON object per line
+    webhook:https://example.com/hook      POST a JSON array per batch
+    socket:/tmp/calls.sock                newline-delimited JSON over a unix socket
+    socket:127.0.0.1:9000                 ... or over TCP
+"""
+import json
+import time
+import queue
+import socket
+import threading
+
+import requests
+
+
+class Sink:
+    """Batched, asynchronous writer; subclasses implement write_batch()"""
+
+    def __init__(self, name, batch_size=50, flush_interval=1.0, max_queue=1000, max_retries=5, retry_backoff=1.0):
+        self.name = name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.stats = {"sent": 0, "dropped": 0, "failed": 0}
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._closing = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"sink-{name}", daemon=True)
+        self._thread.start()
+
+    def emit(self, event):
+        """Queue an event without blocking; drops the oldest event when full"""
+        while True:
+            try:
+                self._queue.put_nowait(event)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self.stats["dropped"] += 1
+                except queue.Empty:
+                    pass
+
+    def close(self, timeout=5):
+        """Flush what is queued (up to timeout seconds) and stop the writer"""
+        self._closing.set()
+        self._thread.join(timeout)
+
+    def write_batch(self, events):
+        raise NotImplementedError
+
+    def _next_batch(self):
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while not (self._closing.is_set() and self._queue.empty()):
+            batch = self._next_batch()
+            if not batch:
+                continue
+
+            for attempt in range(self.max_retries + 1):
+                try:
+                    self.write_batch(batch)
+                    self.stats["sent"] += len(batch)
+                    break
+                except Exception as e:
+                    if attempt == self.max_retries or self._closing.is_set():
+                        self.stats["failed"] += len(batch)
+                        print(f"[❌] Sink {self.name} dropped {len(batch)} events: {e}")
+                        break
+                    time.sleep(self.retry_backoff * 2 ** attempt)
+
+
+class JsonlFileSink(Sink):
+    """Append events to a JSON Lines file"""
+
+    def __init__(self, path, **kwargs):
+        self.path = path
+        super().__init__(f"jsonl:{path}", **kwargs)
+
+    def write_batch(self, events):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(event, ensure_ascii=False) + "\n" for event in events))
+
+
+class WebhookSink(Sink):
+    """POST each batch as a JSON array"""
+
+    def __init__(self, url, timeout=10, **kwargs):
+        self.url = url
+        self.timeout = timeout
+        self._session = requests.Session()
+        super().__init__(f"webhook:{url}", **kwargs)
+
+    def write_batch(self, events):
+        res = self._session.post(self.url, json=events, timeout=self.timeout)
+        res.raise_for_status()
+
+
+class SocketSink(Sink):
+    """Newline-delimited JSON over a unix socket path or host:port"""
+
+    def __init__(self, address, timeout=5, **kwargs):
+        self.address = address
+        self.timeout = timeout
+        self._sock = None
+        super().__init__(f"socket:{address}", **kwargs)
+
+    def _connect(self):
+        host, _, port = self.address.rpartition(":")
+        if host and port.isdigit():
+            return socket.create_connection((host, int(port)), timeout=self.timeout)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.address)
+        return sock
+
+    def write_batch(self, events):
+        if self._sock is None:
+            self._sock = self._connect()
+        data = "".join(json.dumps(event, ensure_ascii=False) + "\n" for event in events).encode("utf-8")
+        try:
+            self._sock.sendall(data)
+        except OSError:
+            # Reconnect on the next attempt
+            self._sock.close()
+            self._sock = None
+            raise
+
+
+SINK_TYPES = {
+    "jsonl": JsonlFileSink,
+    "webhook": WebhookSink,
+    "socket": SocketSink,
+}
+
+
+def open_sink(spec, **kwargs):
+    """Create a sink from a "kind:target" spec"""
+    kind, _, target = spec.strip().partition(":")
+    if kind not in SINK_TYPES or not target:
+        raise ValueError(f"Invalid sink spec: {spec}")
+    return SINK_TYPES[kind](target, **kwargs)